@@ -0,0 +1,84 @@
+"""
+Top-k attention arcs over long passages.
+
+Drawing every query-key pair of a 512-token passage would take 262,144
+mobjects. Instead the attention matrix is pruned to each query's top-k keys
+with one ``np.argpartition`` call, and all surviving arcs become subpaths of
+a single VMobject whose points are computed in one vectorized step.
+"""
+
+import numpy as np
+from manim import VMobject
+
+from animations.data_cache import cached
+
+
+def wrap_tokens(tokens, chars_per_line):
+    """Greedy line wrap; returns the lines and ``(line, first_char, length)`` per token."""
+    lines = [[]]
+    spans = []
+    width = 0
+    for token in tokens:
+        if width and width + 1 + len(token) > chars_per_line:
+            lines.append([])
+            width = 0
+        start = width + 1 if width else 0
+        spans.append((len(lines) - 1, start, len(token)))
+        lines[-1].append(token)
+        width = start + len(token)
+    return [" ".join(line) for line in lines], np.array(spans)
+
+
+@cached
+def synthetic_attention(tokens, dim=32, locality=0.08, seed=0):
+    """Row-stochastic causal attention weights for ``tokens``.
+
+    Each distinct word gets a random embedding, so repeated words attend to
+    each other, and a distance penalty adds the local focus real heads show.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = {word: i for i, word in enumerate(dict.fromkeys(token.lower() for token in tokens))}
+    ids = np.array([vocabulary[token.lower()] for token in tokens])
+    embeddings = rng.standard_normal((len(vocabulary), dim))
+    projection = rng.standard_normal((dim, dim)) / np.sqrt(dim)
+
+    queries = embeddings[ids] @ projection
+    keys = embeddings[ids]
+    positions = np.arange(len(tokens))
+    distance = positions[:, None] - positions[None, :]
+
+    scores = queries @ keys.T / np.sqrt(dim) - locality * np.abs(distance)
+    # Causal: each token attends to earlier tokens only, the first one to itself
+    scores[distance <= 0] = -np.inf
+    scores[0, 0] = 0.0
+    scores -= scores.max(axis=1, keepdims=True)
+    weights = np.exp(scores)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def top_k_edges(weights, k):
+    """``(queries, keys, weights)`` of every query's ``k`` strongest keys, flattened."""
+    k = min(k, weights.shape[1] - 1)
+    keys = np.argpartition(-weights, k, axis=1)[:, :k]
+    queries = np.repeat(np.arange(len(weights)), k)
+    keys = keys.ravel()
+    strengths = weights[queries, keys]
+    keep = (strengths > 0) & (queries != keys)
+    return queries[keep], keys[keep], strengths[keep]
+
+
+def arc_points(starts, ends, bend=0.35):
+    """Cubic Bézier control points for arcs bowing to the left of each start→end chord."""
+    delta = ends - starts
+    normal = np.stack([-delta[:, 1], delta[:, 0], np.zeros(len(delta))], axis=1)
+    first_handle = starts + delta / 3 + normal * bend
+    second_handle = starts + 2 * delta / 3 + normal * bend
+    return np.stack([starts, first_handle, second_handle, ends], axis=1).reshape(-1, 3)
+
+
+def arc_batch(starts, ends, color, stroke_width=1, opacity=0.35, bend=0.35):
+    """All arcs from ``starts`` to ``ends`` as the subpaths of one VMobject."""
+    arcs = VMobject(stroke_color=color, stroke_width=stroke_width, stroke_opacity=opacity, fill_opacity=0)
+    if len(starts):
+        arcs.set_points(arc_points(starts, ends, bend))
+    return arcs
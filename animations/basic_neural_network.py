@@ -1,18 +1,45 @@
 from manim import *
 import numpy as np
 
-class BasicNeuralNetwork(Scene):
+from animations.components import ComponentFactory
+from animations.glyph_label import GlyphLabel
+from animations.i18n import tr
+from animations.layout import line, place
+from animations.lifecycle import PhaseLifecycleMixin
+from animations.training import at_step, sgd_history
+from animations.tracing import traced
+
+@traced
+class BasicNeuralNetwork(PhaseLifecycleMixin, Scene):
     def construct(self):
+        self.components = ComponentFactory()
+        
         # Title
-        title = Text("Basic Neural Network", font_size=48, color=BLUE)
+        title = Text(tr("basic.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
+        self.pin(title)
         self.wait(1)
         
+        # Build the network
+        with self.phase("Network Structure"):
+            input_layer, hidden_layer, output_layer, connections = self.show_network()
+        
+        # Demonstrate forward propagation
+        with self.phase("Forward Propagation"):
+            self.demonstrate_forward_pass(input_layer, hidden_layer, output_layer, connections)
+        
+        # Show activation function
+        with self.phase("Activation Functions"):
+            self.show_activation_function()
+        
+        self.wait(2)
+    
+    def show_network(self):
         # Create network layers
-        input_layer = self.create_layer(3, "Input Layer", LEFT * 4, GREEN)
-        hidden_layer = self.create_layer(4, "Hidden Layer", ORIGIN, YELLOW)  
-        output_layer = self.create_layer(2, "Output Layer", RIGHT * 4, RED)
+        input_layer = self.create_layer(3, tr("basic.input_layer"), LEFT * 4, GREEN)
+        hidden_layer = self.create_layer(4, tr("basic.hidden_layer"), ORIGIN, YELLOW)  
+        output_layer = self.create_layer(2, tr("basic.output_layer"), RIGHT * 4, RED)
         
         # Animate layer creation
         self.play(
@@ -37,26 +64,18 @@ class BasicNeuralNetwork(Scene):
         connections = self.create_connections(input_layer, hidden_layer)
         connections.extend(self.create_connections(hidden_layer, output_layer))
         
-        self.play(*[Create(line) for line in connections])
+        self.play(*[Create(connection) for connection in connections])
         self.wait(1)
         
-        # Demonstrate forward propagation
-        self.demonstrate_forward_pass(input_layer, hidden_layer, output_layer, connections)
-        
-        # Show activation function
-        self.show_activation_function()
-        
-        self.wait(2)
+        return input_layer, hidden_layer, output_layer, connections
     
     def create_layer(self, num_neurons, label_text, position, color):
-        neurons = []
         spacing = 1.5
         start_y = (num_neurons - 1) * spacing / 2
-        
-        for i in range(num_neurons):
-            neuron = Circle(radius=0.3, color=color, fill_opacity=0.8)
-            neuron.move_to(position + UP * (start_y - i * spacing))
-            neurons.append(neuron)
+        neurons = place(
+            [self.components.neuron(color) for _ in range(num_neurons)],
+            line(num_neurons, position + UP * start_y, DOWN * spacing)
+        )
         
         label = Text(label_text, font_size=24, color=WHITE)
         label.next_to(neurons[0], UP, buff=0.5)
@@ -69,18 +88,18 @@ class BasicNeuralNetwork(Scene):
         connections = []
         for neuron1 in layer1["neurons"]:
             for neuron2 in layer2["neurons"]:
-                line = Line(
+                connection = Line(
                     neuron1.get_center(),
                     neuron2.get_center(),
                     stroke_width=1,
                     color=GRAY
                 )
-                connections.append(line)
+                connections.append(connection)
         return connections
     
     def demonstrate_forward_pass(self, input_layer, hidden_layer, output_layer, connections):
         # Add input values
-        input_text = Text("Input: [1, 0.5, 0.8]", font_size=20, color=WHITE)
+        input_text = Text(tr("basic.input_values"), font_size=20, color=WHITE)
         input_text.next_to(input_layer["label"], DOWN, buff=0.5)
         self.play(Write(input_text))
         
@@ -133,14 +152,14 @@ class BasicNeuralNetwork(Scene):
         )
         
         # Show output
-        output_text = Text("Output: [0.7, 0.3]", font_size=20, color=WHITE)
+        output_text = Text(tr("basic.output_values"), font_size=20, color=WHITE)
         output_text.next_to(output_layer["label"], DOWN, buff=0.5)
         self.play(Write(output_text))
         self.wait(1)
     
     def show_activation_function(self):
         # Clear previous elements except title
-        self.play(*[FadeOut(mob) for mob in self.mobjects[1:]])
+        self.clear_screen()
         
         # Create activation function graph
         axes = Axes(
@@ -158,10 +177,10 @@ class BasicNeuralNetwork(Scene):
         relu = axes.plot(lambda x: max(0, x), color=RED, x_range=[-4, 4])
         
         # Labels
-        sigmoid_label = Text("Sigmoid", font_size=24, color=BLUE)
-        relu_label = Text("ReLU", font_size=24, color=RED)
+        sigmoid_label = Text(tr("basic.sigmoid"), font_size=24, color=BLUE)
+        relu_label = Text(tr("basic.relu"), font_size=24, color=RED)
         
-        function_title = Text("Activation Functions", font_size=36, color=WHITE)
+        function_title = Text(tr("basic.activation_functions"), font_size=36, color=WHITE)
         function_title.to_edge(UP, buff=1)
         
         sigmoid_label.next_to(sigmoid, RIGHT, buff=0.5)
@@ -175,21 +194,28 @@ class BasicNeuralNetwork(Scene):
         self.wait(2)
 
 
+@traced
 class WeightVisualization(Scene):
+    # SGD steps in the training part (0 leaves it out) and the mapping being learned
+    train_steps = 300
+    target_weights = [[0.9, 0.1], [0.2, 0.7]]
+    
     def construct(self):
-        title = Text("Neural Network Weights", font_size=48, color=BLUE)
+        components = ComponentFactory()
+        
+        title = Text(tr("weights.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
         
         # Create simplified 2x2 network
         input_neurons = [
-            Circle(radius=0.3, color=GREEN, fill_opacity=0.8).move_to(LEFT * 3 + UP),
-            Circle(radius=0.3, color=GREEN, fill_opacity=0.8).move_to(LEFT * 3 + DOWN)
+            components.neuron(GREEN).move_to(LEFT * 3 + UP),
+            components.neuron(GREEN).move_to(LEFT * 3 + DOWN)
         ]
         
         output_neurons = [
-            Circle(radius=0.3, color=RED, fill_opacity=0.8).move_to(RIGHT * 3 + UP),
-            Circle(radius=0.3, color=RED, fill_opacity=0.8).move_to(RIGHT * 3 + DOWN)
+            components.neuron(RED).move_to(RIGHT * 3 + UP),
+            components.neuron(RED).move_to(RIGHT * 3 + DOWN)
         ]
         
         # Create connections with different weights
@@ -202,31 +228,66 @@ class WeightVisualization(Scene):
                 weight = weights[i][j]
                 
                 # Connection thickness represents weight strength
-                line = Line(
+                connection = Line(
                     input_neuron.get_center(),
                     output_neuron.get_center(),
                     stroke_width=weight * 10,
                     color=interpolate_color(BLUE, YELLOW, weight)
                 )
-                connections.append(line)
+                connections.append(connection)
                 
                 # Weight label
-                label = Text(f"{weight}", font_size=16, color=WHITE)
-                label.move_to(line.get_center())
+                label = GlyphLabel(f"{weight}", font_size=16, color=WHITE)
+                label.move_to(connection.get_center())
                 weight_labels.append(label)
         
         # Animate creation
         self.play(*[Create(neuron) for neuron in input_neurons + output_neurons])
-        self.play(*[Create(line) for line in connections])
+        self.play(*[Create(connection) for connection in connections])
         self.play(*[Write(label) for label in weight_labels])
         
         # Explanation text
         explanation = Text(
-            "Thicker lines = Stronger connections (higher weights)",
+            tr("weights.explanation"),
             font_size=24,
             color=WHITE
         )
         explanation.to_edge(DOWN, buff=1)
         self.play(Write(explanation))
         
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+        
+        # Train the network, updating the same lines and labels in place
+        if self.train_steps:
+            self.play(FadeOut(explanation))
+            self.show_training(connections, weight_labels, weights)
+    
+    def show_training(self, connections, weight_labels, initial_weights):
+        history, losses = sgd_history(initial_weights, self.target_weights, steps=self.train_steps)
+        step = ValueTracker(0)
+        
+        def weight(i, j):
+            return at_step(history, step.get_value())[i, j]
+        
+        for index, (connection, label) in enumerate(zip(connections, weight_labels)):
+            i, j = divmod(index, 2)
+            connection.add_updater(lambda connection, i=i, j=j: connection.set_stroke(
+                width=max(abs(weight(i, j)), 0.05) * 10,
+                color=interpolate_color(BLUE, YELLOW, np.clip(weight(i, j), 0, 1))
+            ))
+            label.add_updater(lambda label, i=i, j=j: label.set_text(f"{weight(i, j):.2f}"))
+        
+        progress = GlyphLabel(self.progress_text(step.get_value(), losses), font_size=20, color=WHITE)
+        progress.to_edge(DOWN, buff=1)
+        progress.add_updater(lambda label: label.set_text(self.progress_text(step.get_value(), losses)))
+        
+        self.play(Write(progress))
+        self.play(step.animate.set_value(self.train_steps), run_time=8, rate_func=linear)
+        for mob in connections + weight_labels + [progress]:
+            mob.clear_updaters()
+        
+        self.wait(3)
+    
+    def progress_text(self, step, losses):
+        step = int(step)
+        return tr("weights.training_progress", step=step, steps=len(losses) - 1, loss=losses[step])
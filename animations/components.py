@@ -0,0 +1,76 @@
+"""
+Shared component factory.
+
+Neurons, boxes and labels are built once per style as templates. Scenes get
+cheap copies and hand off-screen ones back so later phases can reuse them
+instead of constructing near-identical mobjects again.
+"""
+
+from collections import defaultdict
+
+from manim import *
+
+
+class ComponentFactory:
+    """Hands out copies of component templates and recycles released ones."""
+
+    # Templates are shared by every factory in the process
+    _templates = {}
+
+    def __init__(self):
+        self._pool = defaultdict(list)
+
+    def neuron(self, color, radius=0.3, fill_opacity=0.8):
+        return self._get(
+            ("neuron", str(color), radius, fill_opacity),
+            lambda: Circle(radius=radius, color=color, fill_opacity=fill_opacity)
+        )
+
+    def box(self, width, height, color, fill_opacity=0.3, corner_radius=0.1):
+        """Rounded box, or a plain rectangle when ``corner_radius`` is None."""
+        def build():
+            if corner_radius is None:
+                return Rectangle(width=width, height=height, color=color, fill_opacity=fill_opacity)
+            return RoundedRectangle(
+                width=width,
+                height=height,
+                corner_radius=corner_radius,
+                color=color,
+                fill_opacity=fill_opacity
+            )
+        return self._get(("box", width, height, str(color), fill_opacity, corner_radius), build)
+
+    def text(self, text, font_size, color=WHITE):
+        return self._get(
+            ("text", text, font_size, str(color)),
+            lambda: Text(text, font_size=font_size, color=color)
+        )
+
+    def labelled_box(self, label, width, height, color, font_size=20, text_color=WHITE,
+                     fill_opacity=0.3, corner_radius=0.1):
+        """Box with a centred label, returned as ``(box, text)`` at the origin."""
+        box = self.box(width, height, color, fill_opacity=fill_opacity, corner_radius=corner_radius)
+        text = self.text(label, font_size, text_color)
+        text.move_to(box.get_center())
+        return box, text
+
+    def recycle(self, *mobjects):
+        """Return component copies that are no longer on screen to the pool."""
+        for mob in mobjects:
+            key = getattr(mob, "_component_key", None)
+            if key is not None and mob not in self._pool[key]:
+                mob.clear_updaters()
+                self._pool[key].append(mob)
+
+    def _get(self, key, build):
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = build()
+
+        pool = self._pool[key]
+        if pool:
+            return pool.pop().become(template)
+
+        mob = template.copy()
+        mob._component_key = key
+        return mob
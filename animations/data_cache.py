@@ -0,0 +1,151 @@
+"""
+Content-addressed disk cache for computed scene data.
+
+``@cached`` stores a function's numpy result in
+``media/cache/data/<name>-<key>.npz``, where the key hashes the function's
+qualified name and source with all its arguments (seeds included, defaults
+applied). Renders at other qualities, previews and parallel workers then
+load the arrays instead of recomputing them.
+
+Entries are written to a temporary file and moved into place with
+``os.replace``, so readers only ever see complete files and concurrent
+writers of the same entry just replace identical content. The ``.npz``
+members are stored uncompressed, which lets reads memory-map each array
+straight out of the archive at its offset instead of copying it into memory.
+Set ``SIMPLE_LLMS_DATA_CACHE=0`` to bypass the cache.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+
+CACHE_ENV = "SIMPLE_LLMS_DATA_CACHE"
+CACHE_DIR = Path("media") / "cache" / "data"
+# Size of a zip local file header before its name and extra fields
+LOCAL_HEADER_SIZE = 30
+
+
+def update_digest(digest, value):
+    """Feed ``value`` into ``digest`` so equal arguments give equal keys."""
+    if isinstance(value, np.ndarray):
+        digest.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            update_digest(digest, key)
+            update_digest(digest, value[key])
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def function_identity(function):
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        source = function.__code__.co_code.hex()
+    return f"{function.__module__}.{function.__qualname__}\n{source}"
+
+
+def encode(result):
+    """Arrays to store for ``result``: an array, a tuple of arrays or a dict of arrays."""
+    if isinstance(result, tuple):
+        return {f"item{i}": np.asarray(item) for i, item in enumerate(result)}
+    if isinstance(result, dict):
+        return {f"field_{key}": np.asarray(value) for key, value in result.items()}
+    return {"value": np.asarray(result)}
+
+
+def decode(arrays):
+    if "value" in arrays:
+        return arrays["value"]
+    if all(name.startswith("item") for name in arrays):
+        return tuple(arrays[f"item{i}"] for i in range(len(arrays)))
+    return {name[len("field_"):]: array for name, array in arrays.items()}
+
+
+def write_entry(path, arrays):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            np.savez(temp_file, **arrays)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_entry(path):
+    """Memory-map every array stored in the uncompressed ``.npz`` at ``path``."""
+    arrays = {}
+    with open(path, "rb") as handle, zipfile.ZipFile(handle) as archive:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} has compressed members")
+            handle.seek(info.header_offset)
+            header = handle.read(LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            handle.seek(info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length)
+
+            version = np.lib.format.read_magic(handle)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+            if dtype.hasobject:
+                raise ValueError(f"{path} holds object arrays")
+
+            name = info.filename[:-len(".npy")]
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=handle.tell(), shape=shape,
+                    order="F" if fortran_order else "C"
+                )
+    return arrays
+
+
+def cached(function):
+    """Cache ``function``'s numpy result on disk, keyed on its code and arguments.
+
+    Results come back as read-only memory maps; copy them before modifying.
+    """
+    signature = inspect.signature(function)
+    identity = function_identity(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if os.environ.get(CACHE_ENV) == "0":
+            return function(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        digest = hashlib.blake2b(identity.encode(), digest_size=16)
+        update_digest(digest, dict(bound.arguments))
+        path = CACHE_DIR / f"{function.__name__}-{digest.hexdigest()}.npz"
+
+        if path.exists():
+            try:
+                return decode(read_entry(path))
+            except (OSError, ValueError, zipfile.BadZipFile):
+                pass  # Damaged entry: compute it again and replace it
+
+        result = function(*args, **kwargs)
+        write_entry(path, encode(result))
+        return result
+
+    return wrapper
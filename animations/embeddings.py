@@ -0,0 +1,56 @@
+"""
+Token embeddings projected into the plane for the embedding-space scene.
+
+Thousands of vectors are reduced with one SVD of the centred matrix (PCA),
+neighbours are found with a single vectorized distance computation, and the
+projected points are drawn as one ``PMobject`` whose point and colour arrays
+the camera rasterizes in bulk, instead of a ``Dot`` mobject per token.
+"""
+
+import numpy as np
+from manim import PMobject, color_to_rgba
+
+from animations.data_cache import cached
+
+
+@cached
+def synthetic_embeddings(num_points=12_000, dim=64, num_clusters=12, spread=0.45, seed=0):
+    """``(vectors, clusters)``: points scattered around ``num_clusters`` random centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((num_clusters, dim))
+    clusters = rng.integers(num_clusters, size=num_points)
+    vectors = centres[clusters] + spread * rng.standard_normal((num_points, dim))
+    return vectors, clusters
+
+
+def pca(vectors, components=3):
+    """Coordinates along the top principal directions and their share of the variance."""
+    centred = vectors - vectors.mean(axis=0)
+    _, singular_values, directions = np.linalg.svd(centred, full_matrices=False)
+    variance = singular_values ** 2
+    return centred @ directions[:components].T, variance[:components] / variance.sum()
+
+
+def nearest_neighbours(vectors, query, k):
+    """Indices of the ``k`` vectors closest to ``vectors[query]``, nearest first."""
+    offsets = vectors - vectors[query]
+    distances = np.einsum("ij,ij->i", offsets, offsets)
+    distances[query] = np.inf
+    nearest = np.argpartition(distances, k)[:k]
+    return nearest[np.argsort(distances[nearest])]
+
+
+def rotated(coordinates, angle):
+    """Scene points of 3D ``coordinates`` turned by ``angle`` about the vertical axis."""
+    x, y, z = coordinates.T
+    return np.stack([x * np.cos(angle) + z * np.sin(angle), y, np.zeros(len(x))], axis=1)
+
+
+def point_cloud(points, palette, groups=None, opacity=0.7, stroke_width=2):
+    """One mobject drawing ``points``, each in the ``palette`` colour of its group."""
+    rgbas = np.array([color_to_rgba(color, opacity) for color in palette])
+    if groups is None:
+        groups = np.zeros(len(points), dtype=int)
+    cloud = PMobject(stroke_width=stroke_width)
+    cloud.add_points(points, rgbas=rgbas[groups])
+    return cloud
@@ -0,0 +1,106 @@
+"""
+Labels that change without new text layouts.
+
+``Text`` runs a Pango layout and SVG parse for every new string, which is
+most of the cost of a counter or probability that changes every frame.
+``GlyphLabel`` lays out each character once per font and size, keeping the
+glyph outline and its advance width, and ``set_text`` re-composes the label
+by copying outline points into the glyph mobjects it already has. Kerning
+and ligatures are not applied.
+"""
+
+from manim import DEFAULT_FONT_SIZE, WHITE, Text, VGroup
+
+
+class GlyphSet:
+    """Outlines and advance widths of characters in one font and size."""
+
+    # Shared by every label in the process, like the component templates
+    _sets = {}
+
+    @classmethod
+    def get(cls, font_size, font=""):
+        key = (font_size, font)
+        if key not in cls._sets:
+            cls._sets[key] = cls(font_size, font)
+        return cls._sets[key]
+
+    def __init__(self, font_size, font=""):
+        self.font_size = font_size
+        self.font = font
+        self.glyphs = {}
+
+        # "H" sits on the baseline; glyphs are stored relative to the pen position after it
+        reference = self.layout("HH")
+        self.reference_advance = reference[1].get_left()[0] - reference[0].get_left()[0]
+        # Styled glyph mobject that label slots are copied from
+        self.slot_template = reference[0]
+
+    def __deepcopy__(self, memo):
+        # Copied labels (e.g. animation targets) share the glyphs
+        return self
+
+    def layout(self, text):
+        return Text(text, font_size=self.font_size, font=self.font, disable_ligatures=True)
+
+    def glyph(self, char):
+        """``(points, advance)`` of ``char``; ``points`` is None for blank characters."""
+        if char not in self.glyphs:
+            if char.isspace():
+                # Blank characters have no outline, so measure the gap they leave
+                reference = self.layout(f"H{char}H")
+                advance = reference[1].get_left()[0] - reference[0].get_left()[0] - self.reference_advance
+                self.glyphs[char] = (None, advance)
+            else:
+                # Doubling the character gives its advance from two identical outlines
+                anchor, first, second = self.layout(f"H{char}{char}")
+                origin = anchor.get_left() + [self.reference_advance, 0, 0]
+                origin[1] = anchor.get_bottom()[1]
+                self.glyphs[char] = (first.points - origin, second.get_left()[0] - first.get_left()[0])
+        return self.glyphs[char]
+
+
+class GlyphLabel(VGroup):
+    """Short text label, e.g. a number, that can change cheaply with ``set_text``."""
+
+    def __init__(self, text="", font_size=DEFAULT_FONT_SIZE, color=WHITE, font="", **kwargs):
+        super().__init__(**kwargs)
+        self.glyph_set = GlyphSet.get(font_size, font)
+        self.label_color = color
+        self.text = None
+        self.spare = []
+        self.set_text(text)
+
+    def set_text(self, text):
+        """Show ``text`` in place, keeping the label's centre."""
+        text = str(text)
+        if text == self.text:
+            return self
+        center = self.get_center() if self.submobjects else None
+
+        slots = self.submobjects + self.spare
+        used = 0
+        pen = 0.0
+        for char in text:
+            points, advance = self.glyph_set.glyph(char)
+            if points is not None:
+                if used == len(slots):
+                    slots.append(self.new_slot())
+                slots[used].set_points(points + [pen, 0, 0])
+                used += 1
+            pen += advance
+
+        self.submobjects = slots[:used]
+        self.spare = slots[used:]
+        self.text = text
+        if center is not None and self.submobjects:
+            self.move_to(center)
+        return self
+
+    def new_slot(self):
+        # Copy a visible glyph so the label's current style carries over
+        if self.submobjects:
+            return self.submobjects[0].copy()
+        slot = self.glyph_set.slot_template.copy()
+        slot.set_fill(self.label_color, opacity=1)
+        return slot
@@ -0,0 +1,41 @@
+"""
+On-screen strings by locale.
+
+Scenes look their text up with ``tr(key)`` instead of hardcoding it. The
+tables live in ``animations/locales/<locale>.json`` and the locale comes from
+``SIMPLE_LLMS_LOCALE`` (default ``en``); keys a locale lacks fall back to
+English.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+LOCALE_ENV = "SIMPLE_LLMS_LOCALE"
+DEFAULT_LOCALE = "en"
+LOCALES_DIR = Path(__file__).resolve().parent / "locales"
+
+
+def current_locale():
+    return os.environ.get(LOCALE_ENV, DEFAULT_LOCALE)
+
+
+def available_locales():
+    return sorted(path.stem for path in LOCALES_DIR.glob("*.json"))
+
+
+@lru_cache(maxsize=None)
+def strings(locale):
+    path = LOCALES_DIR / f"{locale}.json"
+    if not path.exists():
+        raise ValueError(f"No string table for locale '{locale}' (available: {', '.join(available_locales())})")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def tr(key, **values):
+    """The current locale's string (or list of strings) for ``key``, formatted with ``values``."""
+    table = strings(current_locale())
+    text = table[key] if key in table else strings(DEFAULT_LOCALE)[key]
+    return text.format(**values) if values else text
@@ -0,0 +1,42 @@
+"""
+Vectorized positions for rows, grids and stacks of mobjects.
+
+Each layout returns every position as one ``(n, 3)`` array, computed with a
+few numpy operations however many elements there are. A layout placed
+relative to its group is offset once through its ``origin``/``start``
+argument, not by moving each element again afterwards. ``place`` then
+applies the array with one ``move_to`` per mobject: manim keeps points per
+mobject, so that loop is the only per-element step left.
+"""
+
+import numpy as np
+
+
+def line(count, start, step):
+    """``count`` positions from ``start``, each one ``step`` further on: a row or a column."""
+    return np.asarray(start, dtype=float) + np.arange(count)[:, None] * np.asarray(step, dtype=float)
+
+
+def grid(rows, columns, origin, column_step, row_step):
+    """Row-major positions of a grid whose first cell is at ``origin``."""
+    row, column = np.divmod(np.arange(rows * columns), columns)
+    return (
+        np.asarray(origin, dtype=float)
+        + row[:, None] * np.asarray(row_step, dtype=float)
+        + column[:, None] * np.asarray(column_step, dtype=float)
+    )
+
+
+def stack(sizes, start, direction, buff=0.0):
+    """Centres of items ``sizes`` long, laid end to end from ``start`` along ``direction``."""
+    sizes = np.asarray(sizes, dtype=float)
+    direction = np.asarray(direction, dtype=float)
+    offsets = np.cumsum(sizes + buff) - sizes / 2 - buff
+    return np.asarray(start, dtype=float) + offsets[:, None] * (direction / np.linalg.norm(direction))
+
+
+def place(mobjects, positions):
+    """Move the centre of each of ``mobjects`` to the matching row of ``positions``."""
+    for mob, position in zip(mobjects, positions):
+        mob.move_to(position)
+    return mobjects
@@ -0,0 +1,107 @@
+"""
+Scene phases with explicit release of off-screen mobjects.
+
+Each ``show_*`` step of a long scene runs inside ``self.phase(name)``, which
+starts a manim section, calls the ``phase_finished`` hook once the phase's
+last frame is on screen and, when ``SIMPLE_LLMS_MEMORY_REPORT`` is set,
+records the peak memory traced by tracemalloc while the phase runs.
+``clear_screen`` replaces ``self.mobjects[1:]`` slicing and stashed object
+lists: it fades out everything except pinned mobjects and frees what it
+removed.
+"""
+
+import os
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+from manim import FadeOut, logger
+
+
+MEMORY_REPORT_ENV = "SIMPLE_LLMS_MEMORY_REPORT"
+MEMORY_BUDGET_ENV = "SIMPLE_LLMS_MEMORY_BUDGET_MB"
+
+
+def release_mobjects(*mobjects, keep=()):
+    """Drop the updaters, point data and submobjects of ``mobjects``, except ``keep`` and their families."""
+    kept = {id(member) for mob in keep for member in mob.get_family()}
+    for mob in mobjects:
+        family = [member for member in mob.get_family() if id(member) not in kept]
+        for member in family:
+            member.updaters = []
+            member.points = np.zeros((0, member.dim))
+        for member in family:
+            member.submobjects = []
+
+
+def component_members(mob):
+    """Factory-made mobjects in ``mob``'s family, not descending into them."""
+    if hasattr(mob, "_component_key"):
+        return [mob]
+    return [member for submob in mob.submobjects for member in component_members(submob)]
+
+
+class PhaseLifecycleMixin:
+    """Scene mixin that scopes mobjects to phases and frees them when done."""
+
+    def setup(self):
+        super().setup()
+        self.pinned = []
+        self.memory_report = []
+        self.track_memory = bool(os.environ.get(MEMORY_REPORT_ENV))
+        budget = os.environ.get(MEMORY_BUDGET_ENV)
+        self.memory_budget = float(budget) * 1024 ** 2 if budget else None
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def pin(self, *mobjects):
+        """Keep ``mobjects`` (e.g. the scene title) across ``clear_screen`` calls."""
+        self.pinned.extend(mobjects)
+
+    @contextmanager
+    def phase(self, name):
+        self.next_section(name)
+        if self.track_memory:
+            tracemalloc.reset_peak()
+        yield
+        self.phase_finished(name)
+        if self.track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory_report.append((name, peak, current))
+            if self.memory_budget is not None and peak > self.memory_budget:
+                raise MemoryError(
+                    f"Phase '{name}' of {type(self).__name__} peaked at "
+                    f"{peak / 1024 ** 2:.1f} MB, over the {self.memory_budget / 1024 ** 2:.0f} MB budget"
+                )
+
+    def phase_finished(self, name):
+        """Hook run at the end of each phase, before anything is cleared."""
+
+    def clear_screen(self, *keep):
+        """Fade out and release every mobject except pinned ones and ``keep``."""
+        kept = {id(mob) for mob in self.pinned + list(keep)}
+        on_screen = list(getattr(self, "static_layer", [])) + self.mobjects
+        leaving = [mob for mob in on_screen if id(mob) not in kept]
+        visible = [mob for mob in leaving if mob.family_members_with_points()]
+        if visible:
+            self.play(*[FadeOut(mob) for mob in visible])
+        self.remove(*leaving)
+        self.release(*leaving)
+
+    def release(self, *mobjects):
+        """Hand factory-made mobjects back for reuse and free all others."""
+        components = getattr(self, "components", None)
+        # Factory copies may sit inside caller-made groups, so look through whole families
+        reusable = [member for mob in mobjects for member in component_members(mob)] if components else []
+        if reusable:
+            components.recycle(*reusable)
+        release_mobjects(*mobjects, keep=reusable)
+
+    def tear_down(self):
+        super().tear_down()
+        if not self.memory_report:
+            return
+        lines = [f"Peak traced memory per phase of {type(self).__name__}:"]
+        for name, peak, current in self.memory_report:
+            lines.append(f"  {name:<32} peak {peak / 1024 ** 2:8.1f} MB   retained {current / 1024 ** 2:8.1f} MB")
+        logger.info("\n".join(lines))
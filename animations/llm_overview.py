@@ -1,30 +1,54 @@
 from manim import *
 import numpy as np
 
-class LLMOverview(Scene):
+from animations.attention_arcs import arc_batch
+from animations.components import ComponentFactory
+from animations.embeddings import nearest_neighbours, pca, point_cloud, rotated, synthetic_embeddings
+from animations.glyph_label import GlyphLabel
+from animations.i18n import tr
+from animations.layout import line, place
+from animations.lifecycle import PhaseLifecycleMixin
+from animations.reveal import reveal, sequence, together
+from animations.sampling import bar_points, sampling_distribution
+from animations.static_layer import StaticLayerMixin
+from animations.tracing import traced
+
+@traced
+class LLMOverview(PhaseLifecycleMixin, StaticLayerMixin, Scene):
     def construct(self):
+        self.components = ComponentFactory()
+        
         # Title
-        title = Text("Large Language Model Overview", font_size=42, color=BLUE)
+        title = Text(tr("llm.title"), font_size=42, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
+        self.pin(title)
         self.wait(1)
         
         # Show the complete pipeline
-        self.show_tokenization()
-        self.show_embeddings()
-        self.show_transformer_stack()
-        self.show_generation()
+        with self.phase("Tokenization"):
+            self.show_tokenization()
+        with self.phase("Embeddings"):
+            self.show_embeddings()
+        with self.phase("Transformer Stack"):
+            self.show_transformer_stack()
+        with self.phase("Next Token Generation"):
+            self.show_generation()
+        with self.phase("Sampling"):
+            self.show_sampling_sweep()
+        with self.phase("Autoregressive Generation"):
+            self.show_autoregressive_generation()
         
         self.wait(2)
     
     def show_tokenization(self):
         # Tokenization process
-        tokenization_title = Text("Step 1: Tokenization", font_size=32, color=YELLOW)
+        tokenization_title = Text(tr("llm.tokenization"), font_size=32, color=YELLOW)
         tokenization_title.move_to(UP * 2.5)
         self.play(Write(tokenization_title))
         
         # Input text
-        input_text = Text('"Hello world"', font_size=28, color=GREEN)
+        input_text = Text(tr("llm.input_text"), font_size=28, color=GREEN)
         input_text.move_to(UP * 1)
         
         # Arrow
@@ -32,60 +56,36 @@ class LLMOverview(Scene):
         
         # Tokens
         token_boxes = []
-        tokens = ["Hello", "world"]
-        
-        for i, token in enumerate(tokens):
-            box = RoundedRectangle(
-                width=1.5,
-                height=0.8,
-                corner_radius=0.1,
-                color=BLUE,
-                fill_opacity=0.3
-            )
-            box.move_to(LEFT * 1.5 + RIGHT * (i * 2) + DOWN * 1.5)
-            
-            token_text = Text(token, font_size=20, color=WHITE)
-            token_text.move_to(box.get_center())
+        tokens = tr("llm.tokens")
+        
+        for token, position in zip(tokens, line(len(tokens), LEFT * 1.5 + DOWN * 1.5, RIGHT * 2)):
+            box, token_text = self.components.labelled_box(token, 1.5, 0.8, BLUE)
+            place([box, token_text], [position, position])
             
             token_boxes.append({'box': box, 'text': token_text})
         
         self.play(Write(input_text))
         self.play(Create(arrow1))
         
-        for token_data in token_boxes:
-            self.play(
-                Create(token_data['box']),
-                Write(token_data['text']),
-                run_time=0.5
-            )
+        self.play(sequence(*[
+            together(Create(token_data['box']), Write(token_data['text']), run_time=0.5)
+            for token_data in token_boxes
+        ]))
         
         self.wait(1)
-        
-        # Store for later
-        self.tokenization_objects = [tokenization_title, input_text, arrow1] + \
-                                  [td['box'] for td in token_boxes] + \
-                                  [td['text'] for td in token_boxes]
     
     def show_embeddings(self):
         # Clear tokenization
-        self.play(*[FadeOut(obj) for obj in self.tokenization_objects])
+        self.clear_screen()
         
         # Embeddings title
-        embedding_title = Text("Step 2: Token Embeddings", font_size=32, color=YELLOW)
+        embedding_title = Text(tr("llm.embeddings"), font_size=32, color=YELLOW)
         embedding_title.move_to(UP * 2.5)
         self.play(Write(embedding_title))
         
         # Token to vector conversion
-        token_box = RoundedRectangle(
-            width=1.5,
-            height=0.8,
-            corner_radius=0.1,
-            color=BLUE,
-            fill_opacity=0.3
-        )
+        token_box, token_text = self.components.labelled_box(tr("llm.tokens")[0], 1.5, 0.8, BLUE)
         token_box.move_to(LEFT * 3 + UP * 0.5)
-        
-        token_text = Text("Hello", font_size=20, color=WHITE)
         token_text.move_to(token_box.get_center())
         
         # Arrow
@@ -93,13 +93,11 @@ class LLMOverview(Scene):
         arrow.move_to(UP * 0.5)
         
         # Embedding vector
-        vector_elements = []
         values = [0.2, -0.1, 0.8, 0.3]
-        
-        for i, val in enumerate(values):
-            element = Text(f"{val}", font_size=16, color=GREEN)
-            element.move_to(RIGHT * 3 + UP * (1 - i * 0.4))
-            vector_elements.append(element)
+        vector_elements = place(
+            [Text(f"{val}", font_size=16, color=GREEN) for val in values],
+            line(len(values), RIGHT * 3 + UP * 1, DOWN * 0.4)
+        )
         
         # Vector bracket
         bracket = Text("[", font_size=40, color=WHITE)
@@ -112,61 +110,43 @@ class LLMOverview(Scene):
         self.play(Create(arrow))
         self.play(Write(bracket), Write(bracket_close))
         
-        for element in vector_elements:
-            self.play(Write(element), run_time=0.3)
+        self.play(reveal(Write, vector_elements, run_time=0.3))
         
         # Positional encoding
-        pos_title = Text("+ Positional Encoding", font_size=24, color=ORANGE)
+        pos_title = Text(tr("llm.positional_encoding"), font_size=24, color=ORANGE)
         pos_title.move_to(DOWN * 1)
         self.play(Write(pos_title))
         
         self.wait(2)
-        
-        # Store objects
-        self.embedding_objects = [embedding_title, token_box, token_text, arrow, bracket, bracket_close] + \
-                               vector_elements + [pos_title]
     
     def show_transformer_stack(self):
         # Clear embeddings
-        self.play(*[FadeOut(obj) for obj in self.embedding_objects])
+        self.clear_screen()
         
         # Transformer stack title
-        transformer_title = Text("Step 3: Transformer Layers", font_size=32, color=YELLOW)
+        transformer_title = Text(tr("llm.transformer_layers"), font_size=32, color=YELLOW)
         transformer_title.move_to(UP * 3)
         self.play(Write(transformer_title))
         
         # Create transformer layers
         layers = []
-        layer_names = [
-            "Multi-Head\nAttention",
-            "Feed Forward\nNetwork",
-            "Multi-Head\nAttention",
-            "Feed Forward\nNetwork"
-        ]
+        layer_names = tr("llm.layer_names")
         colors = [BLUE, PURPLE, BLUE, PURPLE]
         
-        for i, (name, color) in enumerate(zip(layer_names, colors)):
-            layer_box = RoundedRectangle(
-                width=3,
-                height=1,
-                corner_radius=0.1,
-                color=color,
-                fill_opacity=0.3
-            )
-            layer_box.move_to(UP * (1.5 - i * 0.8))
-            
-            layer_text = Text(name, font_size=14, color=WHITE)
-            layer_text.move_to(layer_box.get_center())
+        for name, color, position in zip(layer_names, colors, line(len(layer_names), UP * 1.5, DOWN * 0.8)):
+            layer_box, layer_text = self.components.labelled_box(name, 3, 1, color, font_size=14)
+            place([layer_box, layer_text], [position, position])
             
             layers.append({'box': layer_box, 'text': layer_text})
         
         # Animate layer creation
-        for layer in layers:
-            self.play(
-                Create(layer['box']),
-                Write(layer['text']),
-                run_time=0.5
-            )
+        self.play(sequence(*[
+            together(Create(layer['box']), Write(layer['text']), run_time=0.5)
+            for layer in layers
+        ]))
+        
+        # Layers stay put while the arrows animate, so rasterize them once
+        self.add_static(transformer_title, *[l['box'] for l in layers], *[l['text'] for l in layers])
         
         # Add skip connections
         skip_connections = []
@@ -184,7 +164,7 @@ class LLMOverview(Scene):
                     stroke_width=2
                 )
                 skip_connections.append(skip_arrow)
-                self.play(Create(skip_arrow), run_time=0.3)
+        self.play(reveal(Create, skip_connections, run_time=0.3))
         
         # Add data flow arrows
         flow_arrows = []
@@ -197,22 +177,16 @@ class LLMOverview(Scene):
                 stroke_width=2
             )
             flow_arrows.append(arrow)
-            self.play(Create(arrow), run_time=0.2)
+        self.play(reveal(Create, flow_arrows, run_time=0.2))
         
         self.wait(2)
-        
-        # Store objects
-        self.transformer_objects = [transformer_title] + \
-                                 [l['box'] for l in layers] + \
-                                 [l['text'] for l in layers] + \
-                                 skip_connections + flow_arrows
     
     def show_generation(self):
         # Clear transformer stack
-        self.play(*[FadeOut(obj) for obj in self.transformer_objects])
+        self.clear_screen()
         
         # Generation title
-        generation_title = Text("Step 4: Next Token Generation", font_size=32, color=YELLOW)
+        generation_title = Text(tr("llm.next_token"), font_size=32, color=YELLOW)
         generation_title.move_to(UP * 2.5)
         self.play(Write(generation_title))
         
@@ -225,22 +199,22 @@ class LLMOverview(Scene):
         )
         output_layer.move_to(UP * 1)
         
-        output_label = Text("Output Layer", font_size=20, color=RED)
+        output_label = Text(tr("llm.output_layer"), font_size=20, color=RED)
         output_label.move_to(output_layer.get_center())
         
         self.play(Create(output_layer), Write(output_label))
         
         # Probability distribution
-        prob_title = Text("Probability Distribution", font_size=24, color=WHITE)
+        prob_title = Text(tr("llm.probability_distribution"), font_size=24, color=WHITE)
         prob_title.move_to(DOWN * 0.5)
         self.play(Write(prob_title))
         
         # Sample probabilities
-        words = ["the", "cat", "dog", "house"]
+        words = tr("llm.candidate_words")
         probs = [0.4, 0.3, 0.2, 0.1]
         
         bars = []
-        for i, (word, prob) in enumerate(zip(words, probs)):
+        for word, prob, row in zip(words, probs, line(len(words), DOWN * 1.5, DOWN * 0.5)):
             # Probability bar
             bar = Rectangle(
                 width=prob * 4,
@@ -248,76 +222,155 @@ class LLMOverview(Scene):
                 color=interpolate_color(RED, GREEN, prob),
                 fill_opacity=0.8
             )
-            bar.move_to(LEFT * 2 + RIGHT * (prob * 2) + DOWN * (1.5 + i * 0.5))
+            bar.move_to(row + LEFT * 2 + RIGHT * (prob * 2))
             
             # Word label
             word_label = Text(word, font_size=16, color=WHITE)
-            word_label.move_to(LEFT * 3.5 + DOWN * (1.5 + i * 0.5))
+            word_label.move_to(row + LEFT * 3.5)
             
             # Probability label
-            prob_label = Text(f"{prob:.1f}", font_size=14, color=WHITE)
+            prob_label = GlyphLabel(f"{prob:.1f}", font_size=14, color=WHITE)
             prob_label.move_to(bar.get_right() + RIGHT * 0.3)
             
             bars.append({'bar': bar, 'word': word_label, 'prob': prob_label})
         
-        for bar_data in bars:
-            self.play(
-                Create(bar_data['bar']),
-                Write(bar_data['word']),
-                Write(bar_data['prob']),
-                run_time=0.5
-            )
+        self.play(sequence(*[
+            together(Create(bar_data['bar']), Write(bar_data['word']), Write(bar_data['prob']), run_time=0.5)
+            for bar_data in bars
+        ]))
         
         # Selection
-        selection = Text("Selected: 'the'", font_size=24, color=GREEN)
+        selection = Text(tr("llm.selected", word=words[0]), font_size=24, color=GREEN)
         selection.to_edge(DOWN, buff=1)
         self.play(Write(selection))
         
         self.wait(2)
+    
+    def show_sampling_sweep(self):
+        self.clear_screen()
+        
+        sampling_title = Text(tr("llm.sampling"), font_size=32, color=YELLOW)
+        sampling_title.move_to(UP * 2.5)
+        self.play(Write(sampling_title))
+        
+        # The candidate words from the output layer lead a long tail of unlikely tokens
+        words = tr("llm.candidate_words")
+        num_words = len(words)
+        logits = np.concatenate([np.log([0.4, 0.3, 0.2, 0.1]) + 2.5, np.linspace(-0.5, -3, 28)])
+        
+        # Bar rows: wide labelled rows for the words, thin ones for the tail
+        rows = np.concatenate([
+            1.7 - 0.45 * np.arange(num_words),
+            -0.15 - 0.085 * np.arange(len(logits) - num_words)
+        ])
+        thickness = np.where(np.arange(len(logits)) < num_words, 0.3, 0.06)
+        left = -3.5
+        bar_scale = 7
+        
+        word_labels = []
+        for word, row in zip(words, rows):
+            word_label = Text(word, font_size=16, color=WHITE)
+            word_label.next_to([left, row, 0], LEFT, buff=0.2)
+            word_labels.append(word_label)
+        tail_label = Text(tr("llm.other_tokens", count=len(logits) - num_words), font_size=14, color=GRAY_B)
+        tail_label.next_to([left, rows[num_words:].mean(), 0], LEFT, buff=0.2)
+        
+        # Two mobjects hold every bar; prob labels only exist for the words
+        top_bars = VMobject(fill_color=GREEN, fill_opacity=0.8, stroke_width=0)
+        tail_bars = VMobject(fill_color=BLUE, fill_opacity=0.6, stroke_width=0)
+        prob_labels = [GlyphLabel("0.00", font_size=14, color=WHITE) for _ in words]
+        setting = GlyphLabel(tr("llm.sampling_setting", temperature="1.00", top_p="1.00"), font_size=22, color=YELLOW)
+        setting.move_to(DOWN * 3)
+        
+        temperature = ValueTracker(1.0)
+        top_p = ValueTracker(1.0)
+        
+        def redraw(mob):
+            probs = sampling_distribution(logits, temperature.get_value(), top_p.get_value())
+            points = bar_points(left, rows, probs * bar_scale, thickness)
+            top_bars.set_points(points[:16 * num_words])
+            tail_bars.set_points(points[16 * num_words:])
+            for label, prob, row in zip(prob_labels, probs, rows):
+                label.set_text(f"{prob:.2f}")
+                label.move_to([left + prob * bar_scale + 0.2 + label.width / 2, row, 0])
+            setting.set_text(tr(
+                "llm.sampling_setting",
+                temperature=f"{temperature.get_value():.2f}",
+                top_p=f"{top_p.get_value():.2f}"
+            ))
+        
+        # One mobject owns everything redraw changes, so once it is on screen the
+        # renderer redraws all of it every frame whatever the drawing order
+        sweep = VGroup(top_bars, tail_bars, *prob_labels, setting)
+        redraw(sweep)
+        self.play(
+            FadeIn(top_bars), FadeIn(tail_bars), FadeIn(tail_label), FadeIn(VGroup(*prob_labels)),
+            *[Write(word_label) for word_label in word_labels],
+            Write(setting)
+        )
+        self.remove(*sweep)
+        self.add(sweep)
+        sweep.add_updater(redraw)
+        
+        low_caption = Text(tr("llm.temperature_low"), font_size=20, color=WHITE)
+        low_caption.to_edge(DOWN, buff=0.3)
+        self.play(temperature.animate.set_value(0.3), FadeIn(low_caption), run_time=3)
+        self.wait(1)
         
-        # Show autoregressive process
-        self.show_autoregressive_generation()
+        high_caption = Text(tr("llm.temperature_high"), font_size=20, color=WHITE)
+        high_caption.to_edge(DOWN, buff=0.3)
+        self.play(temperature.animate.set_value(2.0), ReplacementTransform(low_caption, high_caption), run_time=4)
+        self.wait(1)
+        
+        top_p_caption = Text(tr("llm.top_p", percent=50), font_size=20, color=WHITE)
+        top_p_caption.to_edge(DOWN, buff=0.3)
+        self.play(
+            temperature.animate.set_value(1.0),
+            top_p.animate.set_value(0.5),
+            ReplacementTransform(high_caption, top_p_caption),
+            run_time=4
+        )
+        sweep.remove_updater(redraw)
+        self.wait(2)
     
     def show_autoregressive_generation(self):
         # Clear previous
-        self.play(*[FadeOut(mob) for mob in self.mobjects[1:]])
+        self.clear_screen()
         
         # Autoregressive title
-        auto_title = Text("Autoregressive Generation", font_size=36, color=YELLOW)
+        auto_title = Text(tr("llm.autoregressive"), font_size=36, color=YELLOW)
         auto_title.move_to(UP * 3)
         self.play(Write(auto_title))
         
         # Show sequence generation
-        sequence = ["Hello", "world", "how", "are", "you"]
+        generated = tr("llm.generated_sequence")
         generated_tokens = []
+        current_process_text = None
         
-        for i, token in enumerate(sequence):
-            token_box = RoundedRectangle(
-                width=1.2,
-                height=0.8,
-                corner_radius=0.1,
-                color=BLUE,
-                fill_opacity=0.3
-            )
-            token_box.move_to(LEFT * 4 + RIGHT * (i * 1.5) + UP * 1)
-            
-            token_text = Text(token, font_size=16, color=WHITE)
-            token_text.move_to(token_box.get_center())
+        positions = line(len(generated), LEFT * 4 + UP * 1, RIGHT * 1.5)
+        for i, (token, position) in enumerate(zip(generated, positions)):
+            token_box, token_text = self.components.labelled_box(token, 1.2, 0.8, BLUE, font_size=16)
+            place([token_box, token_text], [position, position])
             
             generated_tokens.append({'box': token_box, 'text': token_text})
             
             # Show generation process
             if i == 0:
                 # First token
-                process_text = Text(f"Generate: '{token}'", font_size=20, color=GREEN)
+                process_text = Text(tr("llm.generate", token=token), font_size=20, color=GREEN)
                 process_text.move_to(DOWN * 1)
                 self.play(Write(process_text))
+                current_process_text = process_text
             else:
-                # Subsequent tokens
-                context = " ".join(sequence[:i])
-                process_text = Text(f"Context: '{context}' → '{token}'", font_size=16, color=GREEN)
-                process_text.move_to(DOWN * 1)
-                self.play(Transform(self.mobjects[-1], process_text))
+                # Subsequent tokens re-compose one label instead of laying out new text
+                context = tr("llm.context", context=" ".join(generated[:i]), token=token)
+                if i == 1:
+                    process_text = GlyphLabel(context, font_size=16, color=GREEN)
+                    process_text.move_to(DOWN * 1)
+                    self.play(ReplacementTransform(current_process_text, process_text))
+                    current_process_text = process_text
+                else:
+                    self.play(current_process_text.animate.set_text(context))
             
             # Create token
             self.play(
@@ -330,7 +383,7 @@ class LLMOverview(Scene):
         
         # Final explanation
         final_text = Text(
-            "Each new token is generated based on all previous tokens",
+            tr("llm.final_explanation"),
             font_size=20,
             color=WHITE
         )
@@ -340,36 +393,151 @@ class LLMOverview(Scene):
         self.wait(3)
 
 
+@traced
+class EmbeddingSpace(PhaseLifecycleMixin, Scene):
+    num_points = 12_000
+    dimensions = 64
+    num_clusters = 12
+    num_neighbours = 24
+    palette = [BLUE, GREEN, RED, YELLOW, PURPLE, ORANGE, TEAL, PINK, MAROON, GOLD, LIGHT_BROWN, GRAY_B]
+    centre = DOWN * 0.4
+    
+    def construct(self):
+        title = Text(tr("embedding.title"), font_size=40, color=BLUE)
+        title.to_edge(UP, buff=0.4)
+        self.play(Write(title))
+        self.pin(title)
+        
+        vectors, clusters = synthetic_embeddings(self.num_points, self.dimensions, self.num_clusters)
+        coordinates, variance = pca(vectors)
+        # One scale for the flat view and the rotation, fitted below the title
+        coordinates = coordinates * min(
+            5.5 / np.abs(coordinates[:, 0]).max(),
+            2.6 / np.abs(coordinates[:, 1]).max()
+        )
+        flat = rotated(coordinates, 0) + self.centre
+        
+        with self.phase("Token Cloud"):
+            cloud = self.show_cloud(flat, clusters, variance)
+        
+        with self.phase("Clusters"):
+            self.show_clusters(flat, clusters)
+        
+        with self.phase("Nearest Neighbours"):
+            self.show_neighbours(cloud, vectors, flat, clusters)
+        
+        with self.phase("Three Directions"):
+            self.show_rotation(cloud, coordinates, variance)
+        
+        explanation = Text(tr("embedding.explanation"), font_size=22, color=WHITE)
+        explanation.to_edge(DOWN, buff=0.3)
+        self.play(Write(explanation))
+        self.wait(2)
+    
+    def caption(self, text):
+        caption = Text(text, font_size=20, color=WHITE)
+        caption.to_edge(DOWN, buff=0.3)
+        return caption
+    
+    def show_cloud(self, flat, clusters, variance):
+        # Every token is one point of a single mobject
+        cloud = point_cloud(flat, self.palette, clusters)
+        count_caption = self.caption(tr("embedding.count_caption", points=f"{self.num_points:,}", dim=self.dimensions))
+        self.play(Create(cloud), Write(count_caption), run_time=2)
+        self.wait(1)
+        
+        pca_caption = self.caption(tr("embedding.pca_caption", variance=f"{100 * variance[:2].sum():.0f}"))
+        self.play(ReplacementTransform(count_caption, pca_caption))
+        self.wait(2)
+        self.play(FadeOut(pca_caption))
+        self.remove(pca_caption)
+        self.release(pca_caption)
+        return cloud
+    
+    def show_clusters(self, flat, clusters):
+        # Cluster centres from per-cluster coordinate sums
+        counts = np.bincount(clusters, minlength=self.num_clusters)
+        centres = np.stack([
+            np.bincount(clusters, weights=flat[:, axis], minlength=self.num_clusters)
+            for axis in range(3)
+        ], axis=1) / counts[:, None]
+        
+        labels = []
+        for cluster, (name, centre) in enumerate(zip(tr("embedding.clusters"), centres)):
+            label = Text(name, font_size=18, color=WHITE, weight=BOLD)
+            label.move_to(centre)
+            labels.append(label)
+        
+        self.play(reveal(FadeIn, labels, run_time=0.3, gap=0.1))
+        self.wait(2)
+        self.play(*[FadeOut(label) for label in labels])
+        self.remove(*labels)
+        self.release(*labels)
+    
+    def show_neighbours(self, cloud, vectors, flat, clusters):
+        caption = self.caption(tr("embedding.neighbours_caption", k=self.num_neighbours, dim=self.dimensions))
+        cloud.save_state()
+        self.play(cloud.animate.fade_to(BLACK, 0.75), Write(caption))
+        
+        highlight = None
+        for cluster in (0, self.num_clusters // 3, 2 * self.num_clusters // 3):
+            query = int(np.flatnonzero(clusters == cluster)[0])
+            neighbours = nearest_neighbours(vectors, query, self.num_neighbours)
+            links = arc_batch(np.repeat(flat[[query]], len(neighbours), axis=0), flat[neighbours], WHITE, opacity=0.6, bend=0)
+            marks = point_cloud(flat[neighbours], [YELLOW], opacity=1, stroke_width=6)
+            marker = Dot(flat[query], radius=0.08, color=YELLOW)
+            current = Group(links, marks, marker)
+            
+            if highlight is None:
+                self.play(Create(links), Create(marks), FadeIn(marker))
+                highlight = current
+            else:
+                self.play(Transform(highlight, current))
+            self.wait(1)
+        
+        self.play(FadeOut(highlight), FadeOut(caption), Restore(cloud))
+        self.remove(highlight, caption)
+        self.release(highlight, caption)
+    
+    def show_rotation(self, cloud, coordinates, variance):
+        caption = self.caption(tr("embedding.rotation_caption", variance=f"{100 * variance[2]:.0f}"))
+        self.play(Write(caption))
+        
+        # Turn the three principal directions, rewriting the points in place
+        angle = ValueTracker(0)
+        
+        def turn(mob):
+            mob.points[:] = rotated(coordinates, angle.get_value()) + self.centre
+        
+        cloud.add_updater(turn)
+        self.play(angle.animate.set_value(2 * PI), run_time=8, rate_func=linear)
+        cloud.remove_updater(turn)
+        self.play(FadeOut(caption))
+        self.remove(caption)
+        self.release(caption)
+
+
+@traced
 class LLMCapabilities(Scene):
     def construct(self):
-        title = Text("LLM Capabilities", font_size=48, color=BLUE)
+        title = Text(tr("capabilities.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
         
         # Capabilities list
-        capabilities = [
-            "Text Generation",
-            "Language Translation",
-            "Question Answering",
-            "Code Generation",
-            "Creative Writing",
-            "Reasoning & Analysis"
-        ]
-        
-        capability_objects = []
-        for i, capability in enumerate(capabilities):
-            cap_text = Text(f"• {capability}", font_size=24, color=WHITE)
-            cap_text.move_to(UP * (2 - i * 0.6) + LEFT * 2)
-            capability_objects.append(cap_text)
+        capabilities = tr("capabilities.list")
+        
+        capability_objects = place(
+            [Text(f"• {capability}", font_size=24, color=WHITE) for capability in capabilities],
+            line(len(capabilities), UP * 2 + LEFT * 2, DOWN * 0.6)
+        )
         
         # Animate capabilities
-        for cap in capability_objects:
-            self.play(Write(cap), run_time=0.5)
-            self.wait(0.3)
+        self.play(reveal(Write, capability_objects, run_time=0.5, gap=0.3))
         
         # Key insight
         insight = Text(
-            "All from learning patterns in text data!",
+            tr("capabilities.insight"),
             font_size=28,
             color=YELLOW
         )
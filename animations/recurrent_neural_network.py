@@ -1,35 +1,52 @@
 from manim import *
 import numpy as np
 
-class RecurrentNeuralNetwork(Scene):
+from animations.components import ComponentFactory
+from animations.glyph_label import GlyphLabel
+from animations.gradient_flow import SCALES, gradient_log_norms
+from animations.i18n import tr
+from animations.lifecycle import PhaseLifecycleMixin
+from animations.reveal import sequence, together
+from animations.sequence_benchmark import load_benchmark
+from animations.tracing import traced
+
+@traced
+class RecurrentNeuralNetwork(PhaseLifecycleMixin, Scene):
     def construct(self):
+        self.components = ComponentFactory()
+        
         # Title
-        title = Text("Recurrent Neural Network (RNN)", font_size=42, color=BLUE)
+        title = Text(tr("rnn.title"), font_size=42, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
+        self.pin(title)
         self.wait(1)
         
         # Show the concept of memory first
-        self.show_memory_concept()
+        with self.phase("Memory Concept"):
+            self.show_memory_concept()
         
         # Show RNN cell
-        self.show_rnn_cell()
+        with self.phase("RNN Cell"):
+            self.show_rnn_cell()
         
         # Show unrolled RNN
-        self.show_unrolled_rnn()
+        with self.phase("Unrolled RNN"):
+            self.show_unrolled_rnn()
         
         # Demonstrate sequence processing
-        self.demonstrate_sequence_processing()
+        with self.phase("Sequence Processing"):
+            self.demonstrate_sequence_processing()
         
         self.wait(2)
     
     def show_memory_concept(self):
         # Memory concept explanation
-        memory_text = Text("Key Concept: Memory", font_size=36, color=YELLOW)
+        memory_text = Text(tr("rnn.memory_concept"), font_size=36, color=YELLOW)
         memory_text.move_to(ORIGIN)
         
         explanation = Text(
-            "RNNs can remember information from previous inputs",
+            tr("rnn.memory_explanation"),
             font_size=24,
             color=WHITE
         )
@@ -39,7 +56,7 @@ class RecurrentNeuralNetwork(Scene):
         self.play(Write(explanation))
         self.wait(2)
         
-        self.play(FadeOut(memory_text), FadeOut(explanation))
+        self.clear_screen()
     
     def show_rnn_cell(self):
         # Create RNN cell
@@ -53,17 +70,17 @@ class RecurrentNeuralNetwork(Scene):
         rnn_cell.move_to(ORIGIN)
         
         # RNN label
-        rnn_label = Text("RNN", font_size=24, color=WHITE)
+        rnn_label = Text(tr("rnn.cell"), font_size=24, color=WHITE)
         rnn_label.move_to(rnn_cell.get_center())
         
         # Input arrow
         input_arrow = Arrow(LEFT * 3, rnn_cell.get_left(), color=GREEN)
-        input_label = Text("Input\nx(t)", font_size=20, color=GREEN)
+        input_label = Text(tr("rnn.input"), font_size=20, color=GREEN)
         input_label.next_to(input_arrow, LEFT, buff=0.2)
         
         # Output arrow
         output_arrow = Arrow(rnn_cell.get_right(), RIGHT * 3, color=RED)
-        output_label = Text("Output\nh(t)", font_size=20, color=RED)
+        output_label = Text(tr("rnn.output"), font_size=20, color=RED)
         output_label.next_to(output_arrow, RIGHT, buff=0.2)
         
         # Hidden state feedback loop
@@ -78,7 +95,7 @@ class RecurrentNeuralNetwork(Scene):
             stroke_width=3
         )
         
-        hidden_label = Text("Hidden State\nh(t-1)", font_size=16, color=YELLOW)
+        hidden_label = Text(tr("rnn.hidden_state"), font_size=16, color=YELLOW)
         hidden_label.next_to(feedback_path.get_top(), UP, buff=0.2)
         
         # Animate creation
@@ -90,25 +107,13 @@ class RecurrentNeuralNetwork(Scene):
         self.play(Create(feedback_path), Write(hidden_label))
         
         self.wait(2)
-        
-        # Store for later use
-        self.rnn_components = {
-            'cell': rnn_cell,
-            'label': rnn_label,
-            'input_arrow': input_arrow,
-            'input_label': input_label,
-            'output_arrow': output_arrow,
-            'output_label': output_label,
-            'feedback': feedback_path,
-            'hidden_label': hidden_label
-        }
     
     def show_unrolled_rnn(self):
         # Clear previous
-        self.play(*[FadeOut(comp) for comp in self.rnn_components.values()])
+        self.clear_screen()
         
         # Create unrolled RNN
-        subtitle = Text("Unrolled RNN Through Time", font_size=32, color=YELLOW)
+        subtitle = Text(tr("rnn.unrolled"), font_size=32, color=YELLOW)
         subtitle.move_to(UP * 2.5)
         self.play(Write(subtitle))
         
@@ -119,31 +124,24 @@ class RecurrentNeuralNetwork(Scene):
         
         for t in range(time_steps):
             # RNN cell
-            cell = RoundedRectangle(
-                width=1.5,
-                height=1.2,
-                corner_radius=0.1,
-                color=BLUE,
-                fill_opacity=0.3
-            )
+            cell, time_label = self.components.labelled_box(f"t={t}", 1.5, 1.2, BLUE, font_size=16)
             cell.move_to(LEFT * 4 + RIGHT * (t * 2.5))
             
             # Time label
-            time_label = Text(f"t={t}", font_size=16, color=WHITE)
             time_label.move_to(cell.get_center())
             
             # Input
-            input_circle = Circle(radius=0.2, color=GREEN, fill_opacity=0.8)
+            input_circle = self.components.neuron(GREEN, radius=0.2)
             input_circle.move_to(cell.get_center() + DOWN * 1.5)
             
-            input_text = Text(f"x{t}", font_size=14, color=GREEN)
+            input_text = self.components.text(f"x{t}", 14, GREEN)
             input_text.move_to(input_circle.get_center())
             
             # Output
-            output_circle = Circle(radius=0.2, color=RED, fill_opacity=0.8)
+            output_circle = self.components.neuron(RED, radius=0.2)
             output_circle.move_to(cell.get_center() + UP * 1.5)
             
-            output_text = Text(f"h{t}", font_size=14, color=RED)
+            output_text = self.components.text(f"h{t}", 14, RED)
             output_text.move_to(output_circle.get_center())
             
             # Input arrow
@@ -187,33 +185,28 @@ class RecurrentNeuralNetwork(Scene):
                 connections.append(connection)
         
         # Animate creation
+        steps = []
         for i, cell_components in enumerate(cells):
-            self.play(
-                *[Create(comp) for comp in cell_components.values()],
-                run_time=0.5
-            )
+            steps.append(together(*[Create(comp) for comp in cell_components.values()], run_time=0.5))
             if i < len(connections):
-                self.play(Create(connections[i]), run_time=0.3)
+                steps.append(together(Create(connections[i]), run_time=0.3))
+        self.play(sequence(*steps))
         
         self.wait(2)
-        
-        # Store for sequence demo
-        self.unrolled_cells = cells
-        self.connections = connections
-        self.subtitle = subtitle
     
     def demonstrate_sequence_processing(self):
         # Clear and set up for sequence demo
-        self.play(*[FadeOut(mob) for mob in self.mobjects[1:]])  # Keep title
+        self.clear_screen()  # Keep title
         
         # Demo title
-        demo_title = Text("Processing Sequence: 'Hello'", font_size=32, color=YELLOW)
+        word = tr("rnn.sequence_word")
+        demo_title = Text(tr("rnn.processing_sequence", word=word), font_size=32, color=YELLOW)
         demo_title.move_to(UP * 3)
         self.play(Write(demo_title))
         
         # Create sequence processing visualization
-        sequence = ['H', 'e', 'l', 'l', 'o']
-        time_steps = len(sequence)
+        characters = list(word)
+        time_steps = len(characters)
         
         # Create cells for sequence
         cells = []
@@ -224,17 +217,11 @@ class RecurrentNeuralNetwork(Scene):
             x_pos = LEFT * 6 + RIGHT * (t * 3)
             
             # RNN cell
-            cell = RoundedRectangle(
-                width=1.8,
-                height=1.5,
-                corner_radius=0.1,
-                color=BLUE,
-                fill_opacity=0.3
-            )
+            cell = self.components.box(1.8, 1.5, BLUE)
             cell.move_to(x_pos)
             
             # Input character
-            char_text = Text(sequence[t], font_size=32, color=GREEN)
+            char_text = Text(characters[t], font_size=32, color=GREEN)
             char_text.move_to(cell.get_center() + DOWN * 2)
             
             # Hidden state visualization (changing colors/shapes)
@@ -246,7 +233,7 @@ class RecurrentNeuralNetwork(Scene):
             hidden_state.move_to(cell.get_center() + UP * 2)
             
             # Time step label
-            time_label = Text(f"t={t+1}", font_size=16, color=WHITE)
+            time_label = GlyphLabel(f"t={t+1}", font_size=16, color=WHITE)
             time_label.next_to(cell, DOWN, buff=1.5)
             
             cells.append({
@@ -257,16 +244,17 @@ class RecurrentNeuralNetwork(Scene):
             })
         
         # Animate sequence processing step by step
+        steps = []
         for i, cell_data in enumerate(cells):
             # Show current input
-            self.play(
+            steps.append([
                 Create(cell_data['cell']),
                 Write(cell_data['char']),
                 Write(cell_data['time'])
-            )
+            ])
             
             # Process and show hidden state
-            self.play(Create(cell_data['hidden']))
+            steps.append(Create(cell_data['hidden']))
             
             # Show connection to next state if not last
             if i < len(cells) - 1:
@@ -276,13 +264,14 @@ class RecurrentNeuralNetwork(Scene):
                     color=YELLOW,
                     stroke_width=3
                 )
-                self.play(Create(connection))
+                steps.append(Create(connection))
             
-            self.wait(0.5)
+            steps.append(Wait(0.5))
+        self.play(sequence(*steps))
         
         # Final explanation
         final_text = Text(
-            "Each hidden state carries information from all previous inputs",
+            tr("rnn.final_explanation"),
             font_size=24,
             color=WHITE
         )
@@ -292,29 +281,30 @@ class RecurrentNeuralNetwork(Scene):
         self.wait(3)
 
 
+@traced
 class RNNProblems(Scene):
     def construct(self):
-        title = Text("RNN Challenges", font_size=48, color=BLUE)
+        title = Text(tr("rnn_problems.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
         
         # Vanishing gradient problem
-        problem1 = Text("1. Vanishing Gradient Problem", font_size=32, color=RED)
+        problem1 = Text(tr("rnn_problems.vanishing_gradient"), font_size=32, color=RED)
         problem1.move_to(UP * 1.5)
         
         explanation1 = Text(
-            "Information from early time steps gets lost",
+            tr("rnn_problems.vanishing_gradient_explanation"),
             font_size=24,
             color=WHITE
         )
         explanation1.next_to(problem1, DOWN, buff=0.3)
         
         # Long-term dependency problem
-        problem2 = Text("2. Long-term Dependencies", font_size=32, color=RED)
+        problem2 = Text(tr("rnn_problems.long_term"), font_size=32, color=RED)
         problem2.move_to(DOWN * 0.5)
         
         explanation2 = Text(
-            "Difficulty remembering information over long sequences",
+            tr("rnn_problems.long_term_explanation"),
             font_size=24,
             color=WHITE
         )
@@ -325,10 +315,128 @@ class RNNProblems(Scene):
         self.wait(1)
         self.play(Write(problem2))
         self.play(Write(explanation2))
+        self.wait(1)
+        
+        # Make the vanishing gradient concrete
+        self.play(*[FadeOut(mob) for mob in (problem1, explanation1, problem2, explanation2)])
+        self.show_gradient_decay()
         
         # Solution preview
-        solution = Text("Solution: Attention Mechanism!", font_size=36, color=GREEN)
+        solution = Text(tr("rnn_problems.solution"), font_size=36, color=GREEN)
         solution.to_edge(DOWN, buff=1)
         self.play(Write(solution))
         
+        self.wait(3)
+    
+    def show_gradient_decay(self):
+        # Gradient size k steps back through a 10,000-step sequence, per recurrent weight scale
+        log_norms = gradient_log_norms(SCALES, steps=10_000)
+        steps = log_norms.shape[1]
+        y_min, y_max = -30, 10
+        
+        axes = Axes(
+            x_range=[0, steps, steps // 4],
+            y_range=[y_min, y_max, 10],
+            x_length=9,
+            y_length=3.6,
+            tips=False,
+            axis_config={"color": WHITE}
+        )
+        axes.move_to(UP * 0.5)
+        x_labels = VGroup(*[
+            Text(f"{step:,}", font_size=14, color=WHITE).next_to(axes.c2p(step, y_min), DOWN, buff=0.2)
+            for step in range(0, steps + 1, steps // 4)
+        ])
+        y_labels = VGroup(*[
+            Text(f"1e{power}", font_size=14, color=WHITE).next_to(axes.c2p(0, power), LEFT, buff=0.2)
+            for power in range(y_min, y_max + 1, 10)
+        ])
+        x_title = Text(tr("rnn_problems.steps_back"), font_size=18, color=WHITE)
+        x_title.next_to(x_labels, DOWN, buff=0.15)
+        y_title = Text(tr("rnn_problems.gradient_size"), font_size=18, color=WHITE)
+        y_title.next_to(axes, UP, buff=0.2).align_to(axes, LEFT)
+        
+        self.play(Create(axes), Write(x_labels), Write(y_labels), Write(x_title), Write(y_title))
+        
+        # 200 samples per curve, clipped to the plotted range
+        samples = np.linspace(0, steps - 1, 200).astype(int)
+        curves = VGroup()
+        legend = VGroup()
+        for scale, values, color in zip(SCALES, log_norms, [RED, ORANGE, YELLOW, GREEN]):
+            curves.add(axes.plot_line_graph(
+                samples, np.clip(values[samples], y_min, y_max), line_color=color, add_vertex_dots=False
+            ))
+            legend.add(Text(tr("rnn_problems.weight_scale", scale=scale), font_size=16, color=color))
+        legend.arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+        legend.next_to(axes, RIGHT, buff=0.3)
+        
+        self.play(sequence(*[together(Create(curve), Write(label)) for curve, label in zip(curves, legend)]))
+        self.wait(2)
+        
+        self.play(*[FadeOut(mob) for mob in (axes, x_labels, y_labels, x_title, y_title, curves, legend)])
+
+
+@traced
+class RNNSpeedBenchmark(Scene):
+    def construct(self):
+        title = Text(tr("benchmark.title"), font_size=40, color=BLUE)
+        title.to_edge(UP, buff=0.5)
+        self.play(Write(title))
+        
+        # Timings measured on this machine (cached after the first render)
+        results = load_benchmark()
+        exponents = np.log2(results["lengths"])
+        rnn_ms = np.log10(np.array(results["rnn"]) * 1000)
+        attention_ms = np.log10(np.array(results["attention"]) * 1000)
+        y_min = np.floor(min(rnn_ms.min(), attention_ms.min()))
+        y_max = np.ceil(max(rnn_ms.max(), attention_ms.max()))
+        
+        # Log-log axes: sequence length doubles per step, time in powers of ten
+        axes = Axes(
+            x_range=[exponents[0], exponents[-1], 1],
+            y_range=[y_min, y_max, 1],
+            x_length=9,
+            y_length=4.5,
+            tips=False,
+            axis_config={"color": WHITE}
+        )
+        axes.move_to(DOWN * 0.3)
+        x_labels = VGroup(*[
+            Text(str(length), font_size=14, color=WHITE).next_to(axes.c2p(exponent, y_min), DOWN, buff=0.2)
+            for length, exponent in zip(results["lengths"], exponents)
+        ])
+        y_labels = VGroup(*[
+            Text(f"{10 ** power:g} ms", font_size=14, color=WHITE).next_to(axes.c2p(exponents[0], power), LEFT, buff=0.2)
+            for power in np.arange(y_min, y_max + 1)
+        ])
+        x_title = Text(tr("benchmark.x_axis"), font_size=18, color=WHITE)
+        x_title.next_to(x_labels, DOWN, buff=0.2)
+        
+        self.play(Create(axes), Write(x_labels), Write(y_labels), Write(x_title))
+        
+        # Measured curves
+        rnn_curve = axes.plot_line_graph(exponents, rnn_ms, line_color=RED, vertex_dot_radius=0.05)
+        attention_curve = axes.plot_line_graph(exponents, attention_ms, line_color=GREEN, vertex_dot_radius=0.05)
+        rnn_label = Text(tr("benchmark.rnn_label"), font_size=18, color=RED)
+        rnn_label.next_to(axes.c2p(exponents[-1], rnn_ms[-1]), RIGHT, buff=0.2)
+        attention_label = Text(tr("benchmark.attention_label"), font_size=18, color=GREEN)
+        attention_label.next_to(axes.c2p(exponents[-1], attention_ms[-1]), RIGHT, buff=0.2)
+        
+        self.play(Create(rnn_curve), Write(rnn_label), run_time=2)
+        self.play(Create(attention_curve), Write(attention_label), run_time=2)
+        
+        # Numbers for the longest sequence
+        summary = Text(
+            tr(
+                "benchmark.summary",
+                length=results["lengths"][-1],
+                rnn=results["rnn"][-1] * 1000,
+                attention=results["attention"][-1] * 1000
+            ),
+            font_size=20,
+            color=YELLOW
+        )
+        summary.to_edge(DOWN, buff=0.3)
+        self.play(Write(summary))
+        
         self.wait(3)
\ No newline at end of file
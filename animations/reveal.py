@@ -0,0 +1,43 @@
+"""
+Batched reveal helpers.
+
+Scenes often reveal a collection with a loop of one ``self.play`` per element.
+Every play becomes its own partial movie file, so these helpers fold such a
+loop into a single animation with the same timing.
+"""
+
+from manim import Animation, AnimationGroup, Wait
+
+
+def together(*animations, run_time=None):
+    """Animations that start at the same time, like one ``self.play(a, b)``."""
+    if run_time is not None:
+        for animation in animations:
+            animation.run_time = run_time
+    return AnimationGroup(*animations)
+
+
+def sequence(*steps, gap=0.0):
+    """Play ``steps`` back to back as one animation.
+
+    Each step is an animation or a list of animations played together, and is
+    followed by a pause of ``gap`` seconds. The result matches a loop of
+    ``self.play(*step)`` and ``self.wait(gap)`` calls. A step must not
+    animate a mobject that another step of the same sequence animates.
+    """
+    timed = []
+    for step in steps:
+        if not isinstance(step, Animation):
+            step = together(*step)
+        if gap:
+            step = AnimationGroup(step, Wait(run_time=step.run_time + gap))
+        timed.append(step)
+    return AnimationGroup(*timed, lag_ratio=1)
+
+
+def reveal(animation_class, mobjects, run_time=None, gap=0.0, **kwargs):
+    """Reveal ``mobjects`` one after another with ``animation_class``."""
+    return sequence(
+        *[together(animation_class(mob, **kwargs), run_time=run_time) for mob in mobjects],
+        gap=gap
+    )
@@ -0,0 +1,54 @@
+"""
+Next-token distributions under temperature and top-p, drawn as bar batches.
+
+A sweep recomputes the whole distribution from the logits with one
+vectorized softmax per frame, and ``bar_points`` turns the resulting array
+into the outline points of every bar at once, so a frame costs the same
+handful of numpy calls however many bars are on screen.
+"""
+
+import numpy as np
+
+
+def softmax(logits, temperature=1.0):
+    scaled = np.asarray(logits, dtype=float) / max(temperature, 1e-6)
+    scaled -= scaled.max(axis=-1, keepdims=True)
+    weights = np.exp(scaled)
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+
+def top_p_filter(probs, top_p):
+    """``probs`` restricted to the fewest most likely entries reaching ``top_p``, renormalized."""
+    order = np.argsort(-probs)
+    cumulative = np.cumsum(probs[order])
+    # Keep every entry whose preceding mass is still below top_p, so the top one always survives
+    keep = np.empty(len(probs), dtype=bool)
+    keep[order] = cumulative - probs[order] < top_p
+    filtered = np.where(keep, probs, 0.0)
+    return filtered / filtered.sum()
+
+
+def sampling_distribution(logits, temperature=1.0, top_p=1.0):
+    return top_p_filter(softmax(logits, temperature), top_p)
+
+
+def bar_points(lefts, rows, lengths, thickness):
+    """Outline points of horizontal bars, one closed subpath of four straight curves each.
+
+    Bar ``i`` starts at ``lefts[i]`` on row ``rows[i]`` and is ``lengths[i]``
+    long; the result has 16 points per bar, ready for ``VMobject.set_points``.
+    """
+    lefts, rows, lengths, thickness = np.broadcast_arrays(lefts, rows, lengths, thickness)
+    rights = lefts + lengths
+    bottoms = rows - thickness / 2
+    tops = rows + thickness / 2
+    corners = np.stack([
+        np.stack([lefts, rights, rights, lefts, lefts], axis=1),
+        np.stack([bottoms, bottoms, tops, tops, bottoms], axis=1),
+        np.zeros((len(lefts), 5)),
+    ], axis=2)
+    starts = corners[:, :-1]
+    ends = corners[:, 1:]
+    # Straight cubic curves: handles a third and two thirds along each edge
+    curves = np.stack([starts, (2 * starts + ends) / 3, (starts + 2 * ends) / 3, ends], axis=2)
+    return curves.reshape(-1, 3)
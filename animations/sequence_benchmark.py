@@ -0,0 +1,105 @@
+"""
+RNN vs attention timing on the render machine.
+
+Times a numpy RNN that walks a sequence one step at a time against one
+batched self-attention pass over the same sequence, for a range of lengths.
+Results are cached per machine and settings in
+``media/benchmark/sequence_benchmark.json`` so renders reuse them. The cache
+is replaced atomically, since scenes built in parallel workers read it while
+others may be writing it.
+"""
+
+import json
+import os
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+CACHE_FILE = Path("media") / "benchmark" / "sequence_benchmark.json"
+LENGTHS = (16, 32, 64, 128, 256, 512, 1024, 2048)
+DIM = 64
+REPEATS = 5
+
+
+def rnn_forward(inputs, input_weights, recurrent_weights):
+    """Hidden states of a tanh RNN, computed step by step as the recurrence requires."""
+    hidden = np.zeros(recurrent_weights.shape[0])
+    states = np.empty((len(inputs), len(hidden)))
+    for t, x in enumerate(inputs):
+        hidden = np.tanh(input_weights @ x + recurrent_weights @ hidden)
+        states[t] = hidden
+    return states
+
+
+def attention_forward(inputs, query_weights, key_weights, value_weights):
+    """Causal self-attention over the whole sequence in one batched computation."""
+    queries = inputs @ query_weights
+    keys = inputs @ key_weights
+    values = inputs @ value_weights
+    scores = queries @ keys.T / np.sqrt(keys.shape[1])
+    scores[np.triu_indices(len(inputs), k=1)] = -np.inf
+    scores -= scores.max(axis=1, keepdims=True)
+    weights = np.exp(scores)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights @ values
+
+
+def best_time(function, *args, repeats=REPEATS):
+    """Fastest of ``repeats`` runs, in seconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmark(lengths=LENGTHS, dim=DIM, repeats=REPEATS, seed=0):
+    rng = np.random.default_rng(seed)
+    rnn_weights = [rng.standard_normal((dim, dim)) / np.sqrt(dim) for _ in range(2)]
+    attention_weights = [rng.standard_normal((dim, dim)) / np.sqrt(dim) for _ in range(3)]
+
+    results = {"lengths": list(lengths), "rnn": [], "attention": []}
+    for length in lengths:
+        inputs = rng.standard_normal((length, dim))
+        results["rnn"].append(best_time(rnn_forward, inputs, *rnn_weights, repeats=repeats))
+        results["attention"].append(best_time(attention_forward, inputs, *attention_weights, repeats=repeats))
+    return results
+
+
+def cache_key(lengths, dim, repeats):
+    return f"{platform.node()}|{platform.processor()}|numpy {np.__version__}|{list(lengths)}|{dim}|{repeats}"
+
+
+def read_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Missing or damaged: measure again and replace it
+        return {}
+
+
+def write_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w") as temp_file:
+            json.dump(cache, temp_file, indent=1)
+        os.replace(temp_path, CACHE_FILE)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_benchmark(lengths=LENGTHS, dim=DIM, repeats=REPEATS, refresh=False):
+    """Cached results for this machine and settings, measuring them if missing or ``refresh``."""
+    cache = read_cache()
+    key = cache_key(lengths, dim, repeats)
+    if refresh or key not in cache:
+        cache[key] = run_benchmark(lengths, dim, repeats)
+        write_cache(cache)
+    return cache[key]
@@ -0,0 +1,109 @@
+"""
+Cached background layer for diagram-heavy scenes.
+
+Mobjects marked as static are rasterized once into the camera background and
+composited under everything else, instead of being redrawn at the start of
+every play and whenever an animated mobject sits below them.
+"""
+
+import hashlib
+
+import numpy as np
+from manim import Mobject
+from manim.utils.family import extract_mobject_family_members
+
+
+STYLE_ATTRIBUTES = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "pixel_array")
+
+
+def fingerprint(mobjects):
+    """Digest of the geometry and style of ``mobjects`` and their families."""
+    digest = hashlib.blake2b(digest_size=16)
+    for mob in extract_mobject_family_members(mobjects, only_those_with_points=True):
+        for attr in STYLE_ATTRIBUTES:
+            data = getattr(mob, attr, None)
+            if data is not None:
+                digest.update(np.ascontiguousarray(data).tobytes())
+        digest.update(repr((getattr(mob, "stroke_width", None), mob.z_index)).encode())
+    return digest.hexdigest()
+
+
+class StaticLayerMixin:
+    """Scene mixin that keeps persistent mobjects in a cached background layer.
+
+    Call ``add_static`` with the boxes and labels that stay unchanged while a
+    few other parts animate. Animating, re-adding or mutating a static mobject
+    invalidates the cache and returns it to the live scene automatically.
+    Changes are only noticed when a play starts, so static mobjects must not
+    change during a play; mobjects with updaters are kept in the live scene.
+    """
+
+    def setup(self):
+        super().setup()
+        self.static_layer = []
+        self._static_layer_digest = None
+        self._base_background = None
+        # Invisible marker so play-call hashes change with the cached layer
+        self._static_layer_marker = Mobject()
+
+    def add_static(self, *mobjects):
+        # Updaters only run on mobjects in the live scene
+        mobjects = [mob for mob in mobjects if not mob.get_family_updaters()]
+        for mob in mobjects:
+            if mob not in self.static_layer:
+                self.static_layer.append(mob)
+        self.remove(*mobjects)
+        self._rebuild_static_layer()
+
+    def remove_static(self, *mobjects):
+        thawed = [mob for mob in mobjects if mob in self.static_layer]
+        if not thawed:
+            return
+        for mob in thawed:
+            self.static_layer.remove(mob)
+        # Static mobjects were drawn under everything, so they go back at the bottom
+        self.remove(*thawed)
+        self.mobjects = thawed + self.mobjects
+        self._rebuild_static_layer()
+
+    def play(self, *args, **kwargs):
+        if self.static_layer:
+            self._refresh_static_layer(args)
+        super().play(*args, **kwargs)
+
+    def _refresh_static_layer(self, animations):
+        animated = set()
+        for animation in animations:
+            mob = getattr(animation, "mobject", None)
+            if isinstance(mob, Mobject):
+                animated.update(id(member) for member in mob.get_family())
+        animated.update(id(member) for member in self.get_mobject_family_members())
+
+        touched = [
+            mob for mob in self.static_layer
+            if mob.get_family_updaters() or any(id(member) in animated for member in mob.get_family())
+        ]
+        if touched:
+            self.remove_static(*touched)
+        elif fingerprint(self.static_layer) != self._static_layer_digest:
+            self._rebuild_static_layer()
+
+    def _rebuild_static_layer(self):
+        self._static_layer_digest = fingerprint(self.static_layer)
+        marker = self._static_layer_marker
+        marker.static_layer_digest = self._static_layer_digest
+        if self.static_layer and marker not in self.mobjects:
+            self.add(marker)
+        elif not self.static_layer:
+            self.remove(marker)
+
+        camera = getattr(self.renderer, "camera", None)
+        if camera is None:
+            return
+        if self._base_background is None:
+            self._base_background = camera.background
+        camera.background = self._base_background
+        if self.static_layer:
+            camera.reset()
+            camera.capture_mobjects(self.static_layer)
+            camera.background = camera.pixel_array.copy()
@@ -0,0 +1,134 @@
+"""
+Opt-in render tracing in the Chrome trace event format.
+
+With ``SIMPLE_LLMS_TRACE`` set, scenes decorated with ``@traced`` record a
+span for ``construct``, every ``show_*``/``demonstrate_*`` step and
+lifecycle phase, every ``play``/``wait``, every rasterized frame and every encoder call, and write
+``<Scene>.trace.json`` to the directory the variable names (``1`` means
+``media/traces``). Open the file in Perfetto or ``chrome://tracing``.
+
+Without the variable ``@traced`` returns the class untouched, so production
+renders pay nothing for it.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+TRACE_ENV = "SIMPLE_LLMS_TRACE"
+DEFAULT_TRACE_DIR = Path("media") / "traces"
+STEP_PREFIXES = ("show_", "demonstrate_")
+
+
+class Tracer:
+    """Collects complete ("X") trace events for one scene render."""
+
+    def __init__(self):
+        self.events = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+
+    @contextmanager
+    def span(self, name, category, **args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def wrap(self, function, name, category):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}))
+        return path
+
+
+def trace_dir():
+    value = os.environ.get(TRACE_ENV, "")
+    return DEFAULT_TRACE_DIR if value in ("1", "true") else Path(value)
+
+
+def instrument(scene, tracer):
+    """Patch ``scene``'s play/wait, renderer and file writer to record spans."""
+    play = scene.play
+
+    def traced_play(*args, **kwargs):
+        names = [type(arg).__name__ for arg in args]
+        with tracer.span("play", "play", animations=names, section=scene.renderer.file_writer.sections[-1].name):
+            return play(*args, **kwargs)
+
+    scene.play = traced_play
+    scene.wait = tracer.wrap(scene.wait, "wait", "play")
+
+    if hasattr(scene, "phase"):
+        phase = scene.phase
+
+        @contextmanager
+        def traced_phase(name):
+            with tracer.span(name, "phase"), phase(name):
+                yield
+
+        scene.phase = traced_phase
+
+    renderer = scene.renderer
+    renderer.update_frame = tracer.wrap(renderer.update_frame, "rasterize", "render")
+    writer = renderer.file_writer
+    writer.write_frame = tracer.wrap(writer.write_frame, "encode frame", "encode")
+    writer.end_animation = tracer.wrap(writer.end_animation, "finish animation", "encode")
+    writer.combine_to_movie = tracer.wrap(writer.combine_to_movie, "combine movie", "encode")
+
+
+def traced_step(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.tracer.span(method.__name__, "scene"):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def traced_render(render):
+    @functools.wraps(render)
+    def wrapper(self, *args, **kwargs):
+        self.tracer = Tracer()
+        instrument(self, self.tracer)
+        try:
+            with self.tracer.span("render", "scene", scene=type(self).__name__):
+                return render(self, *args, **kwargs)
+        finally:
+            self.tracer.save(trace_dir() / f"{type(self).__name__}.trace.json")
+    return wrapper
+
+
+def traced(scene_class):
+    """Class decorator: trace renders of ``scene_class`` when ``SIMPLE_LLMS_TRACE`` is set."""
+    if not os.environ.get(TRACE_ENV):
+        return scene_class
+    for name, value in list(vars(scene_class).items()):
+        if callable(value) and (name == "construct" or name.startswith(STEP_PREFIXES)):
+            setattr(scene_class, name, traced_step(value))
+    # Subclasses of a traced scene inherit the wrapped render
+    if not getattr(scene_class.render, "_traced", False):
+        scene_class.render = traced_render(scene_class.render)
+        scene_class.render._traced = True
+    return scene_class
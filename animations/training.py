@@ -0,0 +1,49 @@
+"""
+SGD runs of a tiny network for the training animations.
+
+The whole run is computed up front; scenes then drive a ``ValueTracker``
+over the step index and read interpolated weights from the history, so
+animating hundreds of steps only changes existing mobjects' attributes.
+"""
+
+import numpy as np
+
+from animations.data_cache import cached
+
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+@cached
+def sgd_history(initial_weights, target_weights, steps=300, learning_rate=4.0, batch_size=16, seed=0):
+    """Weights and loss before every SGD step of a one-layer sigmoid network.
+
+    The network ``sigmoid(x @ W)`` is fitted to a teacher with
+    ``target_weights`` on random inputs. Returns ``(history, losses)`` with
+    shapes ``(steps + 1, *W.shape)`` and ``(steps + 1,)``.
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.array(initial_weights, dtype=float)
+    target = np.array(target_weights, dtype=float)
+    history = np.empty((steps + 1,) + weights.shape)
+    losses = np.empty(steps + 1)
+
+    for step in range(steps + 1):
+        inputs = rng.uniform(-1, 1, (batch_size, weights.shape[0]))
+        outputs = sigmoid(inputs @ weights)
+        error = outputs - sigmoid(inputs @ target)
+        history[step] = weights
+        losses[step] = np.mean(error ** 2)
+        gradient = inputs.T @ (error * outputs * (1 - outputs)) * 2 / batch_size
+        weights = weights - learning_rate * gradient
+    return history, losses
+
+
+def at_step(history, step):
+    """``history`` linearly interpolated at a fractional ``step``."""
+    step = np.clip(step, 0, len(history) - 1)
+    lower = int(np.floor(step))
+    upper = min(lower + 1, len(history) - 1)
+    fraction = step - lower
+    return (1 - fraction) * history[lower] + fraction * history[upper]
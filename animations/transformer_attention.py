@@ -1,41 +1,60 @@
 from manim import *
 import numpy as np
 
-class AttentionMechanism(Scene):
+from animations.attention_arcs import arc_batch, synthetic_attention, top_k_edges, wrap_tokens
+from animations.components import ComponentFactory
+from animations.glyph_label import GlyphLabel
+from animations.i18n import tr
+from animations.layout import grid, line, place, stack
+from animations.lifecycle import PhaseLifecycleMixin
+from animations.reveal import reveal, sequence, together
+from animations.static_layer import StaticLayerMixin
+from animations.tracing import traced
+
+@traced
+class AttentionMechanism(PhaseLifecycleMixin, Scene):
     def construct(self):
+        self.components = ComponentFactory()
+        
         # Title
-        title = Text("Attention Mechanism", font_size=48, color=BLUE)
+        title = Text(tr("attention.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
+        self.pin(title)
         self.wait(1)
         
         # Show attention concept with human analogy
-        self.show_attention_concept()
+        with self.phase("Attention Concept"):
+            self.show_attention_concept()
         
         # Show self-attention step by step
-        self.show_self_attention()
+        with self.phase("Self-Attention"):
+            sa_title, token_objects = self.show_self_attention()
+        
+        # Show attention computation
+        with self.phase("Attention Computation"):
+            self.demonstrate_attention_computation(sa_title, token_objects)
         
         # Show multi-head attention
-        self.show_multi_head_attention()
+        with self.phase("Multi-Head Attention"):
+            self.show_multi_head_attention()
         
         self.wait(2)
     
     def show_attention_concept(self):
         # Human attention analogy
-        concept_title = Text("Human Attention Analogy", font_size=36, color=YELLOW)
+        concept_title = Text(tr("attention.analogy_title"), font_size=36, color=YELLOW)
         concept_title.move_to(UP * 2)
         
         analogy_text = Text(
-            "When reading a sentence, we focus on relevant words\n"
-            "to understand the current word's meaning",
+            tr("attention.analogy"),
             font_size=24,
             color=WHITE
         )
         analogy_text.move_to(ORIGIN)
         
         example = Text(
-            "Example: 'The cat sat on the mat'\n"
-            "When processing 'sat', we pay attention to 'cat'",
+            tr("attention.example"),
             font_size=20,
             color=GREEN
         )
@@ -46,30 +65,21 @@ class AttentionMechanism(Scene):
         self.play(Write(example))
         self.wait(3)
         
-        self.play(FadeOut(concept_title), FadeOut(analogy_text), FadeOut(example))
+        self.clear_screen()
     
     def show_self_attention(self):
         # Self-attention title
-        sa_title = Text("Self-Attention Mechanism", font_size=36, color=YELLOW)
+        sa_title = Text(tr("attention.self_attention"), font_size=36, color=YELLOW)
         sa_title.move_to(UP * 3)
         self.play(Write(sa_title))
         
         # Input tokens
-        tokens = ["The", "cat", "sat"]
+        tokens = tr("attention.tokens")
         token_objects = []
         
-        for i, token in enumerate(tokens):
-            token_obj = RoundedRectangle(
-                width=1.2,
-                height=0.6,
-                corner_radius=0.1,
-                color=GREEN,
-                fill_opacity=0.3
-            )
-            token_obj.move_to(LEFT * 4 + RIGHT * (i * 2.5) + UP * 1.5)
-            
-            token_text = Text(token, font_size=20, color=WHITE)
-            token_text.move_to(token_obj.get_center())
+        for token, position in zip(tokens, line(len(tokens), LEFT * 4 + UP * 1.5, RIGHT * 2.5)):
+            token_obj, token_text = self.components.labelled_box(token, 1.2, 0.6, GREEN)
+            place([token_obj, token_text], [position, position])
             
             token_objects.append({'box': token_obj, 'text': token_text})
         
@@ -79,16 +89,17 @@ class AttentionMechanism(Scene):
         self.wait(1)
         
         # Show Q, K, V matrices
-        qkv_title = Text("Query, Key, Value Matrices", font_size=24, color=BLUE)
+        qkv_title = Text(tr("attention.qkv_title"), font_size=24, color=BLUE)
         qkv_title.move_to(UP * 0.5)
         self.play(Write(qkv_title))
         
         # Create Q, K, V representations
         qkv_colors = [BLUE, ORANGE, PURPLE]
-        qkv_labels = ["Q (Query)", "K (Key)", "V (Value)"]
+        qkv_labels = tr("attention.qkv_labels")
         qkv_objects = []
         
-        for i, (color, label) in enumerate(zip(qkv_colors, qkv_labels)):
+        positions = line(len(qkv_labels), LEFT * 4 + DOWN * 1, RIGHT * 4)
+        for color, label, position in zip(qkv_colors, qkv_labels, positions):
             # Create matrix representation
             matrix = Rectangle(
                 width=3,
@@ -96,7 +107,7 @@ class AttentionMechanism(Scene):
                 color=color,
                 fill_opacity=0.2
             )
-            matrix.move_to(LEFT * 4 + RIGHT * (i * 4) + DOWN * 1)
+            matrix.move_to(position)
             
             matrix_label = Text(label, font_size=16, color=color)
             matrix_label.next_to(matrix, UP, buff=0.1)
@@ -107,34 +118,31 @@ class AttentionMechanism(Scene):
         self.play(*[Write(obj['label']) for obj in qkv_objects])
         self.wait(1)
         
-        # Show attention computation
-        self.demonstrate_attention_computation(token_objects)
+        return sa_title, token_objects
     
-    def demonstrate_attention_computation(self, token_objects):
+    def demonstrate_attention_computation(self, sa_title, token_objects):
         # Clear previous elements except title and tokens
-        self.play(*[FadeOut(mob) for mob in self.mobjects[4:]])
+        self.clear_screen(
+            sa_title,
+            *[obj['box'] for obj in token_objects],
+            *[obj['text'] for obj in token_objects]
+        )
         
         # Attention computation title
-        comp_title = Text("Attention Computation: Q × K^T", font_size=28, color=YELLOW)
+        comp_title = Text(tr("attention.computation"), font_size=28, color=YELLOW)
         comp_title.move_to(UP * 0.5)
         self.play(Write(comp_title))
         
         # Create attention weight matrix visualization
-        attention_matrix = self.create_attention_matrix()
-        attention_matrix['grid'].move_to(DOWN * 1)
-        # Move all components relative to the grid
-        for cell_row in attention_matrix['cells']:
-            for cell in cell_row:
-                cell.move_to(cell.get_center() + DOWN * 1)
-        for label in attention_matrix['labels']:
-            label.move_to(label.get_center() + DOWN * 1)
-            
+        attention_matrix = self.create_attention_matrix(center=DOWN * 1)
+        
         self.play(Create(attention_matrix['grid']))
         self.play(*[Write(label) for label in attention_matrix['labels']])
         
         # Show attention weights as heatmap
         weights = [[0.1, 0.2, 0.7], [0.3, 0.6, 0.1], [0.4, 0.4, 0.2]]
         
+        steps = []
         for i in range(3):
             for j in range(3):
                 cell = attention_matrix['cells'][i][j]
@@ -142,14 +150,15 @@ class AttentionMechanism(Scene):
                 
                 # Color intensity based on weight
                 cell.set_fill(RED, opacity=weight)
-                weight_text = Text(f"{weight:.1f}", font_size=14, color=WHITE)
+                weight_text = GlyphLabel(f"{weight:.1f}", font_size=14, color=WHITE)
                 weight_text.move_to(cell.get_center())
                 
-                self.play(FadeIn(cell), Write(weight_text), run_time=0.3)
+                steps.append(together(FadeIn(cell), Write(weight_text), run_time=0.3))
+        self.play(sequence(*steps))
         
         # Explanation
         explanation = Text(
-            "Higher values = More attention between tokens",
+            tr("attention.computation_explanation"),
             font_size=20,
             color=WHITE
         )
@@ -158,58 +167,53 @@ class AttentionMechanism(Scene):
         
         self.wait(2)
     
-    def create_attention_matrix(self):
+    def create_attention_matrix(self, center=ORIGIN):
         grid_lines = []
-        cells = []
         labels = []
+        tokens = tr("attention.tokens")
+        size = len(tokens)
+        # Every position is relative to the grid's top-left corner
+        corner = center + (LEFT + UP) * size / 2
         
-        # Create 3x3 grid
-        for i in range(4):
-            # Vertical lines
-            v_line = Line(UP * 1.5 + LEFT * 1.5 + RIGHT * i, DOWN * 1.5 + LEFT * 1.5 + RIGHT * i)
-            grid_lines.append(v_line)
-            
-            # Horizontal lines
-            h_line = Line(LEFT * 1.5 + UP * 1.5 + DOWN * i, RIGHT * 1.5 + UP * 1.5 + DOWN * i)
-            grid_lines.append(h_line)
+        # Vertical lines hang from the top edge, horizontal ones start on the left edge
+        for top, left in zip(line(size + 1, corner, RIGHT), line(size + 1, corner, DOWN)):
+            grid_lines.append(Line(top, top + DOWN * size))
+            grid_lines.append(Line(left, left + RIGHT * size))
         
         # Create cells
-        for i in range(3):
-            row = []
-            for j in range(3):
-                cell = Square(side_length=1, color=WHITE, fill_opacity=0)
-                cell.move_to(LEFT * 1 + RIGHT * j + UP * 1 + DOWN * i)
-                row.append(cell)
-            cells.append(row)
+        cell_positions = grid(size, size, corner + (RIGHT + DOWN) * 0.5, RIGHT, DOWN)
+        squares = place([Square(side_length=1, color=WHITE, fill_opacity=0) for _ in cell_positions], cell_positions)
+        cells = [squares[i * size:(i + 1) * size] for i in range(size)]
         
         # Row and column labels
-        tokens = ["The", "cat", "sat"]
-        for i, token in enumerate(tokens):
+        row_positions = line(size, corner + LEFT + DOWN * 0.5, DOWN)
+        column_positions = line(size, corner + UP + RIGHT * 0.5, RIGHT)
+        for token, row_position, column_position in zip(tokens, row_positions, column_positions):
             # Row labels
             row_label = Text(token, font_size=16, color=WHITE)
-            row_label.move_to(LEFT * 2.5 + UP * 1 + DOWN * i)
+            row_label.move_to(row_position)
             labels.append(row_label)
             
             # Column labels
             col_label = Text(token, font_size=16, color=WHITE)
-            col_label.move_to(LEFT * 1 + RIGHT * i + UP * 2.5)
+            col_label.move_to(column_position)
             labels.append(col_label)
         
-        grid = VGroup(*grid_lines)
+        grid_group = VGroup(*grid_lines)
         
-        return {'grid': grid, 'cells': cells, 'labels': labels}
+        return {'grid': grid_group, 'cells': cells, 'labels': labels}
     
     def show_multi_head_attention(self):
         # Clear previous
-        self.play(*[FadeOut(mob) for mob in self.mobjects[1:]])
+        self.clear_screen()
         
         # Multi-head attention title
-        mha_title = Text("Multi-Head Attention", font_size=36, color=YELLOW)
+        mha_title = Text(tr("attention.multi_head"), font_size=36, color=YELLOW)
         mha_title.move_to(UP * 3)
         self.play(Write(mha_title))
         
         concept_text = Text(
-            "Multiple attention 'heads' focus on different aspects",
+            tr("attention.multi_head_explanation"),
             font_size=24,
             color=WHITE
         )
@@ -219,30 +223,24 @@ class AttentionMechanism(Scene):
         # Create multiple attention heads
         heads = []
         head_colors = [RED, BLUE, GREEN, YELLOW]
-        head_names = ["Head 1\n(Syntax)", "Head 2\n(Semantics)", "Head 3\n(Position)", "Head 4\n(Context)"]
+        head_names = tr("attention.head_names")
         
-        for i, (color, name) in enumerate(zip(head_colors, head_names)):
-            head = RoundedRectangle(
-                width=2,
-                height=1.5,
-                corner_radius=0.1,
-                color=color,
-                fill_opacity=0.3
-            )
-            head.move_to(LEFT * 6 + RIGHT * (i * 3) + UP * 0.5)
-            
-            head_label = Text(name, font_size=14, color=color)
-            head_label.move_to(head.get_center())
+        positions = line(len(head_names), LEFT * 6 + UP * 0.5, RIGHT * 3)
+        for color, name, position in zip(head_colors, head_names, positions):
+            head, head_label = self.components.labelled_box(name, 2, 1.5, color, font_size=14, text_color=color)
+            place([head, head_label], [position, position])
             
             heads.append({'box': head, 'label': head_label})
         
         # Animate head creation
-        for head in heads:
-            self.play(Create(head['box']), Write(head['label']), run_time=0.5)
+        self.play(sequence(*[
+            together(Create(head['box']), Write(head['label']), run_time=0.5)
+            for head in heads
+        ]))
         
         # Show concatenation
         concat_arrow = Arrow(UP * 0.5, DOWN * 1.5, color=WHITE)
-        concat_label = Text("Concatenate", font_size=20, color=WHITE)
+        concat_label = Text(tr("attention.concatenate"), font_size=20, color=WHITE)
         concat_label.next_to(concat_arrow, RIGHT, buff=0.2)
         
         output_box = RoundedRectangle(
@@ -254,7 +252,7 @@ class AttentionMechanism(Scene):
         )
         output_box.move_to(DOWN * 2)
         
-        output_label = Text("Final Attention Output", font_size=20, color=PURPLE)
+        output_label = Text(tr("attention.final_output"), font_size=20, color=PURPLE)
         output_label.move_to(output_box.get_center())
         
         self.play(Create(concat_arrow), Write(concat_label))
@@ -263,66 +261,238 @@ class AttentionMechanism(Scene):
         self.wait(2)
 
 
-class TransformerArchitecture(Scene):
+@traced
+class LongContextAttention(PhaseLifecycleMixin, Scene):
+    num_tokens = 512
+    top_k = 4
+    chars_per_line = 128
+    
     def construct(self):
-        title = Text("Transformer Architecture", font_size=48, color=BLUE)
+        self.components = ComponentFactory()
+        
+        title = Text(tr("long_context.title"), font_size=40, color=BLUE)
+        title.to_edge(UP, buff=0.4)
+        self.play(Write(title))
+        self.pin(title)
+        
+        with self.phase("Long Passage"):
+            tokens, positions = self.show_passage()
+        
+        with self.phase("Top-k Arcs"):
+            weights = synthetic_attention(tokens)
+            queries, keys, _ = top_k_edges(weights, self.top_k)
+            arcs = self.show_arcs(positions, queries, keys)
+        
+        with self.phase("Single Queries"):
+            self.show_single_queries(positions, queries, keys, arcs)
+        
+        self.wait(2)
+    
+    def show_passage(self):
+        # Repeat the passage up to num_tokens words
+        words = tr("long_context.passage").split()
+        tokens = [words[i % len(words)] for i in range(self.num_tokens)]
+        lines, spans = wrap_tokens(tokens, self.chars_per_line)
+        
+        # Monospace lines scaled to a common character width, so token
+        # positions follow from character offsets
+        char_width = 13 / self.chars_per_line
+        line_height = min(0.26, 5.6 / len(lines))
+        left = -6.5
+        top = 2.9
+        line_objects = []
+        for i, line_string in enumerate(lines):
+            line_text = Text(line_string, font="Monospace", font_size=12, color=GRAY_B)
+            line_text.scale_to_fit_width(char_width * len(line_string))
+            line_text.move_to([left + line_text.width / 2, top - i * line_height, 0])
+            line_objects.append(line_text)
+        
+        line_index, first_char, length = spans.T
+        positions = np.stack([
+            left + (first_char + length / 2) * char_width,
+            top - line_index * line_height,
+            np.zeros(len(spans))
+        ], axis=1)
+        
+        caption = Text(tr("long_context.passage_caption", tokens=self.num_tokens), font_size=20, color=WHITE)
+        caption.to_edge(DOWN, buff=0.3)
+        
+        self.play(FadeIn(VGroup(*line_objects), lag_ratio=0.05), run_time=2)
+        self.play(Write(caption))
+        self.wait(1)
+        self.play(FadeOut(caption))
+        self.remove(caption)
+        self.release(caption)
+        return tokens, positions
+    
+    def show_arcs(self, positions, queries, keys):
+        # Every surviving edge is one subpath of a single mobject
+        arcs = arc_batch(positions[queries], positions[keys], BLUE, stroke_width=1, opacity=0.35)
+        
+        caption = Text(
+            tr("long_context.arcs_caption", pairs=f"{self.num_tokens ** 2:,}", k=self.top_k, arcs=f"{len(queries):,}"),
+            font_size=20,
+            color=WHITE
+        )
+        caption.to_edge(DOWN, buff=0.3)
+        
+        self.play(Create(arcs), run_time=3)
+        self.play(Write(caption))
+        self.wait(2)
+        self.play(FadeOut(caption))
+        self.remove(caption)
+        self.release(caption)
+        return arcs
+    
+    def show_single_queries(self, positions, queries, keys, arcs):
+        self.play(arcs.animate.set_stroke(opacity=0.08))
+        
+        highlight = None
+        for query in (self.num_tokens // 4, self.num_tokens // 2, self.num_tokens - 1):
+            mask = queries == query
+            query_arcs = arc_batch(positions[queries[mask]], positions[keys[mask]], YELLOW, stroke_width=3, opacity=1)
+            marker = Dot(positions[query], radius=0.06, color=YELLOW)
+            key_markers = VGroup(*[Dot(point, radius=0.05, color=ORANGE) for point in positions[keys[mask]]])
+            current = VGroup(query_arcs, marker, key_markers)
+            
+            if highlight is None:
+                self.play(FadeIn(marker), Create(query_arcs), FadeIn(key_markers))
+                highlight = current
+            else:
+                self.play(Transform(highlight, current))
+            self.wait(1)
+        
+        explanation = Text(tr("long_context.explanation"), font_size=20, color=WHITE)
+        explanation.to_edge(DOWN, buff=0.3)
+        self.play(Write(explanation))
+        self.wait(2)
+
+
+@traced
+class TransformerArchitecture(StaticLayerMixin, Scene):
+    # Model drawn by the diagram
+    num_layers = 3
+    num_heads = 8
+    model_width = 512
+    # Deeper stacks show the first layers, a "× N" row and the last layer
+    max_visible_layers = 4
+    leading_layers = 2
+    max_head_marks = 8
+    
+    def construct(self):
+        components = ComponentFactory()
+        
+        title = Text(tr("transformer.title"), font_size=48, color=BLUE)
         title.to_edge(UP, buff=0.5)
         self.play(Write(title))
         
         # Create simplified transformer diagram
         # Input embeddings
-        input_box = Rectangle(width=3, height=0.8, color=GREEN, fill_opacity=0.3)
+        input_box, input_label = components.labelled_box(
+            tr("transformer.input_embeddings"), 3, 0.8, GREEN, font_size=16, text_color=GREEN, corner_radius=None
+        )
         input_box.move_to(DOWN * 3)
-        input_label = Text("Input Embeddings", font_size=16, color=GREEN)
         input_label.move_to(input_box.get_center())
         
         # Positional encoding
-        pos_box = Rectangle(width=3, height=0.8, color=ORANGE, fill_opacity=0.3)
+        pos_box, pos_label = components.labelled_box(
+            tr("transformer.positional_encoding"), 3, 0.8, ORANGE, font_size=16, text_color=ORANGE, corner_radius=None
+        )
         pos_box.next_to(input_box, UP, buff=0.2)
-        pos_label = Text("+ Positional Encoding", font_size=16, color=ORANGE)
         pos_label.move_to(pos_box.get_center())
         
-        # Multi-head attention layers
-        attention_boxes = []
-        for i in range(3):
-            box = Rectangle(width=4, height=1, color=BLUE, fill_opacity=0.3)
-            if i == 0:
-                box.next_to(pos_box, UP, buff=0.5)
+        # Multi-head attention layers, shrunk so any number of rows fills the space of three
+        rows = self.layer_rows()
+        row_height = (3.6 - 0.3 * (len(rows) - 1)) / len(rows)
+        layer_template = self.create_layer_template(components, row_height)
+        
+        attention_layers = []
+        for row in rows:
+            if row is None:
+                collapsed = self.num_layers - self.leading_layers - 1
+                layer = VGroup(components.text(tr("transformer.collapsed_layers", count=collapsed), 16, BLUE))
+                frame = layer_template[0].copy().set_opacity(0)
+                layer.add_to_back(frame)
             else:
-                box.next_to(attention_boxes[i-1], UP, buff=0.3)
-            
-            label = Text(f"Multi-Head Attention {i+1}", font_size=14, color=BLUE)
-            label.move_to(box.get_center())
-            
-            attention_boxes.append({'box': box, 'label': label})
+                # Box and head marks are copies of one instance, only the label is new
+                layer = layer_template.copy()
+                label = components.text(tr("transformer.attention_layer", index=row), 14, BLUE)
+                label.move_to(layer[0].get_center() + UP * row_height * 0.2)
+                layer.add(label)
+            attention_layers.append(layer)
+        # Stack the rows upwards from the positional encoding box in one pass
+        place(attention_layers, stack([row_height] * len(rows), pos_box.get_top() + UP * 0.5, UP, buff=0.3))
         
         # Output
-        output_box = Rectangle(width=3, height=0.8, color=RED, fill_opacity=0.3)
-        output_box.next_to(attention_boxes[-1]['box'], UP, buff=0.5)
-        output_label = Text("Output", font_size=16, color=RED)
+        output_box, output_label = components.labelled_box(
+            tr("transformer.output"), 3, 0.8, RED, font_size=16, text_color=RED, corner_radius=None
+        )
+        output_box.next_to(attention_layers[-1], UP, buff=0.5)
         output_label.move_to(output_box.get_center())
         
+        dimensions = Text(
+            tr("transformer.dimensions", layers=self.num_layers, heads=self.num_heads, width=self.model_width),
+            font_size=16,
+            color=GRAY
+        )
+        dimensions.next_to(attention_layers[len(rows) // 2], RIGHT, buff=0.5)
+        
         # Animate creation
         self.play(Create(input_box), Write(input_label))
         self.play(Create(pos_box), Write(pos_label))
         
-        for attention_data in attention_boxes:
-            self.play(Create(attention_data['box']), Write(attention_data['label']))
+        self.play(sequence(*[
+            [Create(layer[0]), *[Write(part) for part in layer[1:]]]
+            for layer in attention_layers
+        ]))
         
         self.play(Create(output_box), Write(output_label))
+        self.play(Write(dimensions))
+        
+        # Boxes stay unchanged from here on, so rasterize them once. The layer
+        # parts were animated one by one, so they (not the layer groups) are
+        # what the scene holds
+        self.add_static(
+            title, input_box, input_label, pos_box, pos_label,
+            *[part for layer in attention_layers for part in layer],
+            output_box, output_label, dimensions
+        )
         
         # Add arrows
         arrows = []
-        components = [input_box, pos_box] + [ab['box'] for ab in attention_boxes] + [output_box]
+        stages = [input_box, pos_box] + [layer[0] for layer in attention_layers] + [output_box]
         
-        for i in range(len(components) - 1):
+        for i in range(len(stages) - 1):
             arrow = Arrow(
-                components[i].get_top(),
-                components[i+1].get_bottom(),
+                stages[i].get_top(),
+                stages[i+1].get_bottom(),
                 buff=0.1,
                 color=WHITE
             )
             arrows.append(arrow)
-            self.play(Create(arrow), run_time=0.3)
+        self.play(reveal(Create, arrows, run_time=0.3))
         
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+    
+    def layer_rows(self):
+        """Layer numbers to draw, bottom to top, with None for the collapsed "× N" row."""
+        if self.num_layers <= self.max_visible_layers:
+            return list(range(1, self.num_layers + 1))
+        return list(range(1, self.leading_layers + 1)) + [None, self.num_layers]
+    
+    def create_layer_template(self, components, height):
+        box = components.box(4, height, BLUE, corner_radius=None)
+        
+        # One mark per head, up to max_head_marks
+        mark = Square(side_length=min(0.12, height * 0.2), color=BLUE, fill_opacity=0.8, stroke_width=1)
+        marks = VGroup(*[mark.copy() for _ in range(min(self.num_heads, self.max_head_marks))])
+        marks.arrange(RIGHT, buff=0.06)
+        marks.move_to(box.get_center() + DOWN * height * 0.25)
+        return VGroup(box, marks)
+
+
+class DeepTransformerArchitecture(TransformerArchitecture):
+    # GPT-3 sized stack
+    num_layers = 96
+    num_heads = 96
+    model_width = 12288
\ No newline at end of file
@@ -15,6 +15,45 @@ Usage:
     
     # Render all animations in sequence
     python main.py --render-all
+    
+    # Encode each scene in a single pass, without partial movie files
+    python main.py --render-all --stream
+    python main.py --stream LLMOverview
+    
+    # 4K with flat memory: two scenes at a time, each capped at 1.5 GB resident
+    python main.py --render-all --stream -q k --jobs 2 --max-rss 1536
+    
+    # Render the phases of one long scene in parallel and join them losslessly
+    python main.py --shard LLMOverview --jobs 6
+    
+    # Join the rendered scenes into one chaptered lecture video
+    python main.py --render-all --assemble
+    
+    # Re-render the scenes of each edited animation file at preview quality
+    python main.py --watch
+    
+    # Export the end-of-phase frames of every scene as slide stills
+    python main.py --stills --svg
+    python main.py --stills LLMOverview --sections Tokenization final
+    
+    # Time a step-by-step RNN against batched attention on this machine
+    python main.py --benchmark
+    
+    # Durations and animation counts without rendering, compared with golden/plan.json
+    python main.py --plan
+    python main.py --plan --save-plan
+    
+    # Render a scene in every language, or pick the locales
+    python main.py --variants LLMOverview
+    python main.py --variants LLMOverview --locales en es
+    SIMPLE_LLMS_LOCALE=es manim main.py LLMOverview
+    
+    # Export a JSON timeline and SVG assets for the browser player
+    python main.py --web LLMOverview
+    
+    # Check that the scenes still look like their stored golden frames
+    python main.py --check-golden
+    python main.py --update-golden AttentionMechanism
 
 Animation Sequence:
     1. BasicNeuralNetwork - Fundamental concepts
@@ -24,67 +63,357 @@ Animation Sequence:
 """
 
 from animations.basic_neural_network import BasicNeuralNetwork, WeightVisualization
-from animations.recurrent_neural_network import RecurrentNeuralNetwork, RNNProblems
-from animations.transformer_attention import AttentionMechanism, TransformerArchitecture
-from animations.llm_overview import LLMOverview, LLMCapabilities
-import sys
+from animations.recurrent_neural_network import RecurrentNeuralNetwork, RNNProblems, RNNSpeedBenchmark
+from animations.transformer_attention import (
+    AttentionMechanism, LongContextAttention, TransformerArchitecture, DeepTransformerArchitecture
+)
+from animations.llm_overview import LLMOverview, EmbeddingSpace, LLMCapabilities
+import argparse
 import subprocess
+import sys
 
-def render_all_animations():
-    """Render all animations in the educational sequence."""
-    animations = [
-        ("BasicNeuralNetwork", "Basic neural network concepts and forward propagation"),
-        ("WeightVisualization", "How weights affect network behavior"),
-        ("RecurrentNeuralNetwork", "RNNs and the concept of memory"),
-        ("RNNProblems", "Limitations that led to transformer development"),
-        ("AttentionMechanism", "The attention mechanism breakthrough"),
-        ("TransformerArchitecture", "Complete transformer architecture"),
-        ("LLMOverview", "Complete LLM pipeline from input to output"),
-        ("LLMCapabilities", "What LLMs can do")
-    ]
+# Scenes in lecture order, with a one-line description of each
+ANIMATIONS = [
+    ("BasicNeuralNetwork", "Basic neural network concepts and forward propagation"),
+    ("WeightVisualization", "How weights affect network behavior"),
+    ("RecurrentNeuralNetwork", "RNNs and the concept of memory"),
+    ("RNNProblems", "Limitations that led to transformer development"),
+    ("RNNSpeedBenchmark", "Measured cost of sequential RNN steps vs batched attention"),
+    ("AttentionMechanism", "The attention mechanism breakthrough"),
+    ("LongContextAttention", "Top-k attention over a 512-token passage"),
+    ("TransformerArchitecture", "Complete transformer architecture"),
+    ("LLMOverview", "Complete LLM pipeline from input to output"),
+    ("EmbeddingSpace", "12,000 token embeddings projected with PCA"),
+    ("LLMCapabilities", "What LLMs can do")
+]
+
+def render_scene(animation_class, quality="m", stream=False, max_rss=None):
+    """Render one scene, either through the manim CLI or as a single streamed encode."""
+    if stream:
+        from rendering.streaming import render_streaming
+        render_streaming(animation_class, quality, max_rss_mb=max_rss)
+        return
     
+    cmd = ["manim", "-q", quality, "main.py", animation_class]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+def render_in_parallel(names, quality="m", jobs=None):
+    """Run the manim CLI for several scenes at once; yields ``(name, None or error)``."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    # Each render is its own manim process, so threads only wait on them
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(render_scene, name, quality): name for name in names}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
+
+def render_all_animations(quality="m", stream=False, jobs=None, max_rss=None):
+    """Render all animations in the educational sequence."""
     print("🎬 Rendering Simple LLMs Educational Animation Suite")
     print("=" * 60)
     
-    for i, (animation_class, description) in enumerate(animations, 1):
-        print(f"\n📹 Rendering {i}/{len(animations)}: {animation_class}")
+    if jobs:
+        names = [name for name, _ in ANIMATIONS]
+        if stream:
+            from rendering.streaming import render_streaming_all
+            print(f"\n📹 Streaming {len(ANIMATIONS)} scenes, {jobs} at a time")
+            results = render_streaming_all(names, quality, max_rss, jobs)
+        else:
+            print(f"\n📹 Rendering {len(ANIMATIONS)} scenes, {jobs} at a time")
+            results = render_in_parallel(names, quality, jobs)
+        for animation_class, result in results:
+            if isinstance(result, Exception):
+                print(f"   💥 Exception while rendering {animation_class}: {result}")
+            else:
+                print(f"   ✅ Successfully rendered {animation_class}")
+        print("\n🎉 Animation rendering complete!")
+        return
+    
+    for i, (animation_class, description) in enumerate(ANIMATIONS, 1):
+        print(f"\n📹 Rendering {i}/{len(ANIMATIONS)}: {animation_class}")
         print(f"   {description}")
         
         try:
-            cmd = ["manim", "-q", "m", "main.py", animation_class]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"   ✅ Successfully rendered {animation_class}")
-            else:
-                print(f"   ❌ Failed to render {animation_class}")
-                print(f"   Error: {result.stderr}")
-                
+            render_scene(animation_class, quality, stream, max_rss)
+            print(f"   ✅ Successfully rendered {animation_class}")
+        except RuntimeError as e:
+            print(f"   ❌ Failed to render {animation_class}")
+            print(f"   Error: {e}")
         except Exception as e:
             print(f"   💥 Exception while rendering {animation_class}: {e}")
     
     print("\n🎉 Animation rendering complete!")
     print("📁 Check the 'media' folder for generated videos")
 
+def render_sharded(scenes, quality="m", jobs=None):
+    """Render each scene one section per worker process and stitch the sections together."""
+    from rendering.shards import join_sections, list_sections, render_sections
+    
+    for animation_class in scenes:
+        print(f"🧩 Rendering {animation_class} section by section")
+        try:
+            sections = list_sections(animation_class, quality)
+            movies = {}
+            for index, result in render_sections(animation_class, sections, quality, jobs):
+                section = sections[index][0]
+                if isinstance(result, Exception):
+                    print(f"   ❌ {section}: {result}")
+                else:
+                    movies[index] = result
+                    if result is not None:
+                        print(f"   ✅ {section}")
+            if len(movies) < len(sections):
+                print(f"   ❌ Not joining {animation_class}: some sections failed")
+                continue
+            print(f"   🎞️  Wrote {join_sections(animation_class, sections, movies, quality)}")
+        except Exception as e:
+            print(f"   💥 Exception while rendering {animation_class}: {e}")
+
+def assemble_course(quality="m", output=None):
+    """Join the rendered scenes into one lecture video with a chapter per scene."""
+    from rendering.assembly import assemble_course as assemble
+    
+    print("\n🎞️  Assembling course video")
+    try:
+        path = assemble(ANIMATIONS, quality, output)
+        print(f"   ✅ Wrote {path}")
+    except FileNotFoundError as e:
+        print(f"   ❌ {e}")
+
+def export_stills(scenes, quality="h", sections=None, svg=False, jobs=None):
+    """Export the frame at the end of each phase of ``scenes`` as PNG (and SVG) stills."""
+    from rendering.stills import export_all_stills
+    
+    formats = ("png", "svg") if svg else ("png",)
+    print(f"🖼️  Exporting stills for {len(scenes)} scenes")
+    for animation_class, result in export_all_stills(scenes, quality, sections, formats, jobs):
+        if isinstance(result, Exception):
+            print(f"   ❌ {animation_class}: {result}")
+        else:
+            print(f"   ✅ {animation_class}: {len(result)} files")
+
+def run_benchmark(refresh=False):
+    """Print RNN vs attention timings, measuring them unless cached for this machine."""
+    from animations.sequence_benchmark import load_benchmark
+    
+    results = load_benchmark(refresh=refresh)
+    print("⏱️  RNN (step by step) vs attention (batched)")
+    print(f"   {'tokens':>8} {'RNN ms':>10} {'attention ms':>14}")
+    for length, rnn, attention in zip(results["lengths"], results["rnn"], results["attention"]):
+        print(f"   {length:>8} {rnn * 1000:>10.2f} {attention * 1000:>14.2f}")
+
+def print_plan(scenes, quality="m", save=False):
+    """Dry-run the scenes and print their timing; returns False if it drifted from the saved plan."""
+    from rendering.plan import load_plan, plan_changes, plan_suite, save_plan
+    
+    plans = plan_suite(scenes, quality)
+    print(f"🗓️  Timeline plan ({quality} quality)")
+    for animation_class, plan in plans.items():
+        minutes, seconds = divmod(plan["duration"], 60)
+        print(f"\n📹 {animation_class}: {int(minutes)}:{seconds:04.1f}, "
+              f"{plan['plays']} animations, {plan['waits']} waits, "
+              f"{plan['frames']} frames (~{plan['render_seconds']}s to render)")
+        for section, info in plan["sections"].items():
+            print(f"   {section or '(untitled)':<32} {info['duration']:7.1f}s  {info['plays']:3d} animations")
+    
+    total = sum(plan["duration"] for plan in plans.values())
+    render = sum(plan["render_seconds"] for plan in plans.values())
+    print(f"\n⏱️  Total: {total / 60:.1f} minutes of video, ~{render / 60:.1f} minutes to render")
+    
+    if save:
+        print(f"💾 Saved {save_plan(plans)}")
+        return True
+    saved = load_plan()
+    if saved is None:
+        return True
+    changes = plan_changes(plans, saved)
+    for change in changes:
+        print(f"   ⚠️  {change}")
+    if not changes:
+        print("✅ Matches the saved plan")
+    return not changes
+
+def render_variants(scenes, locales=None, quality="m", jobs=None):
+    """Render each scene once per locale, the base locale first and the rest in parallel from its cache."""
+    from animations.i18n import DEFAULT_LOCALE, available_locales
+    from rendering.variants import render_variants as render
+    
+    locales = locales or [DEFAULT_LOCALE] + [locale for locale in available_locales() if locale != DEFAULT_LOCALE]
+    for animation_class in scenes:
+        print(f"🌍 Rendering {animation_class} in {', '.join(locales)}")
+        try:
+            for locale, result in render(animation_class, locales, quality, jobs):
+                if isinstance(result, Exception):
+                    print(f"   ❌ {locale}: {result}")
+                else:
+                    print(f"   ✅ {locale}: {result}")
+        except Exception as e:
+            print(f"   💥 Exception while rendering {animation_class}: {e}")
+
+def export_web(scenes, quality="m"):
+    """Write each scene as a JSON timeline with SVG assets for browser playback."""
+    from rendering.web import export_web as export
+    
+    print(f"🌐 Exporting {len(scenes)} scenes for the web")
+    for animation_class in scenes:
+        try:
+            print(f"   ✅ {animation_class}: {export(animation_class, quality)}")
+        except Exception as e:
+            print(f"   💥 Exception while exporting {animation_class}: {e}")
+
+def run_golden(scenes, update=False, tolerance=None, jobs=None):
+    """Compare the scenes against their golden frames, or store new ones. Returns True if all pass."""
+    from rendering.golden import TOLERANCE, run_golden as run
+    
+    print(f"🔍 {'Updating' if update else 'Checking'} golden frames for {len(scenes)} scenes")
+    passed = True
+    for animation_class, report in run(scenes, update, TOLERANCE if tolerance is None else tolerance, jobs):
+        if isinstance(report, Exception):
+            print(f"   💥 {animation_class}: {report}")
+            passed = False
+        elif report["failures"]:
+            print(f"   ❌ {animation_class}: {len(report['failures'])} of {report['frames']} frames changed")
+            for failure in report["failures"]:
+                print(f"      {failure}")
+            passed = False
+        else:
+            print(f"   ✅ {animation_class}: {report['frames']} frames")
+    return passed
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Simple LLMs Educational Animation Suite")
+    parser.add_argument("--render-all", action="store_true", help="render every scene in lecture order")
+    parser.add_argument("--stream", nargs="*", metavar="SCENE",
+                        help="encode in a single pass without partial movie files "
+                             "(the listed scenes, or every scene with --render-all)")
+    parser.add_argument("--shard", nargs="+", metavar="SCENE",
+                        help="render each phase of the scenes in its own process and join them without re-encoding")
+    parser.add_argument("--max-rss", type=int, metavar="MB",
+                        help="abort a streamed render whose resident memory goes over MB (per worker)")
+    parser.add_argument("--assemble", action="store_true",
+                        help="join the rendered scenes into one chaptered course video without re-encoding")
+    parser.add_argument("--output", help="path of the assembled course video")
+    parser.add_argument("--watch", action="store_true",
+                        help="re-render the scenes affected by each change under animations/")
+    parser.add_argument("--stills", nargs="*", metavar="SCENE",
+                        help="export the last frame of each phase as a still (the listed scenes, or every scene)")
+    parser.add_argument("--sections", nargs="+", metavar="PHASE",
+                        help="only export stills for these phases ('final' is the last frame)")
+    parser.add_argument("--svg", action="store_true", help="also write stills as SVG")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="time a step-by-step RNN against batched attention (cached per machine)")
+    parser.add_argument("--refresh", action="store_true", help="re-measure instead of using cached benchmark results")
+    parser.add_argument("--plan", nargs="*", metavar="SCENE",
+                        help="dry-run the scenes and report durations without rendering (the listed scenes, or every scene)")
+    parser.add_argument("--save-plan", action="store_true", help="store the --plan results as the reference timings")
+    parser.add_argument("--variants", nargs="*", metavar="SCENE",
+                        help="render the scenes once per locale, reusing the segments without text (the listed scenes, or every scene)")
+    parser.add_argument("--locales", nargs="+", metavar="LOCALE",
+                        help="locales for --variants, base first (default: en then every other table)")
+    parser.add_argument("--web", nargs="*", metavar="SCENE",
+                        help="export a JSON timeline with SVG assets instead of a video (the listed scenes, or every scene)")
+    parser.add_argument("--check-golden", nargs="*", metavar="SCENE",
+                        help="compare low-resolution frames with the stored golden hashes (the listed scenes, or every scene)")
+    parser.add_argument("--update-golden", nargs="*", metavar="SCENE",
+                        help="store the current frames as the golden hashes")
+    parser.add_argument("--tolerance", type=int, help="differing hash bits allowed per golden frame")
+    parser.add_argument("--jobs", type=int, help="number of scenes (or sections, with --shard) to process in parallel")
+    parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"],
+                        help="render quality, as for manim -q (default: m, l with --watch, h with --stills)")
+    args = parser.parse_args()
+    if args.max_rss is not None and args.stream is None:
+        parser.error("--max-rss requires --stream")
+    if args.quality is None:
+        args.quality = "l" if args.watch else "h" if args.stills is not None else "m"
+    return args
+
+def print_usage():
+    print("🎓 Simple LLMs Educational Animation Suite")
+    print("\nAvailable animations:")
+    print("  • BasicNeuralNetwork - Fundamental neural network concepts")
+    print("  • WeightVisualization - Weight importance demonstration")
+    print("  • RecurrentNeuralNetwork - RNNs and memory")
+    print("  • RNNProblems - RNN limitations")
+    print("  • RNNSpeedBenchmark - RNN vs attention timings measured on this machine")
+    print("  • AttentionMechanism - The attention breakthrough")
+    print("  • LongContextAttention - Attention arcs over a long passage")
+    print("  • TransformerArchitecture - Complete transformer")
+    print("  • DeepTransformerArchitecture - The same diagram for a 96-layer model")
+    print("  • LLMOverview - Complete LLM pipeline")
+    print("  • EmbeddingSpace - Token embeddings projected with PCA")
+    print("  • LLMCapabilities - What LLMs can accomplish")
+    print("\nUsage:")
+    print("  manim main.py <AnimationName>")
+    print("  python main.py --render-all")
+    print("  python main.py --stream <AnimationName>")
+    print("  python main.py --shard <AnimationName> --jobs 6")
+    print("  python main.py --assemble")
+    print("  python main.py --watch")
+    print("  python main.py --stills [AnimationName ...]")
+    print("  python main.py --benchmark")
+    print("  python main.py --plan [AnimationName ...]")
+    print("  python main.py --variants [AnimationName ...] --locales en es")
+    print("  python main.py --web [AnimationName ...]")
+    print("  python main.py --check-golden [AnimationName ...]")
+    print("\nFor detailed scripts and concepts, see the 'materials/' folder")
+
 def main():
     """Main entry point for the animation suite."""
-    if len(sys.argv) > 1 and sys.argv[1] == "--render-all":
-        render_all_animations()
-    else:
-        print("🎓 Simple LLMs Educational Animation Suite")
-        print("\nAvailable animations:")
-        print("  • BasicNeuralNetwork - Fundamental neural network concepts")
-        print("  • WeightVisualization - Weight importance demonstration")
-        print("  • RecurrentNeuralNetwork - RNNs and memory")
-        print("  • RNNProblems - RNN limitations")
-        print("  • AttentionMechanism - The attention breakthrough")
-        print("  • TransformerArchitecture - Complete transformer")
-        print("  • LLMOverview - Complete LLM pipeline")
-        print("  • LLMCapabilities - What LLMs can accomplish")
-        print("\nUsage:")
-        print("  manim main.py <AnimationName>")
-        print("  python main.py --render-all")
-        print("\nFor detailed scripts and concepts, see the 'materials/' folder")
+    args = parse_args()
+    
+    if args.watch:
+        from rendering.watch import watch
+        watch(args.quality)
+        return
+    
+    if args.stills is not None:
+        scenes = args.stills or [name for name, _ in ANIMATIONS]
+        export_stills(scenes, args.quality, args.sections, args.svg, args.jobs)
+        return
+    
+    if args.benchmark:
+        run_benchmark(args.refresh)
+        return
+    
+    if args.plan is not None:
+        if not print_plan(args.plan or [name for name, _ in ANIMATIONS], args.quality, args.save_plan):
+            sys.exit(1)
+        return
+    
+    if args.variants is not None:
+        render_variants(args.variants or [name for name, _ in ANIMATIONS], args.locales, args.quality, args.jobs)
+        return
+    
+    if args.web is not None:
+        export_web(args.web or [name for name, _ in ANIMATIONS], args.quality)
+        return
+    
+    golden = args.update_golden if args.update_golden is not None else args.check_golden
+    if golden is not None:
+        scenes = golden or [name for name, _ in ANIMATIONS]
+        if not run_golden(scenes, args.update_golden is not None, args.tolerance, args.jobs):
+            sys.exit(1)
+        return
+    
+    if args.shard:
+        render_sharded(args.shard, args.quality, args.jobs)
+    elif args.render_all:
+        render_all_animations(args.quality, stream=args.stream is not None, jobs=args.jobs, max_rss=args.max_rss)
+    elif args.stream:
+        for animation_class in args.stream:
+            print(f"📹 Streaming {animation_class}")
+            render_scene(animation_class, args.quality, stream=True, max_rss=args.max_rss)
+    elif not args.assemble:
+        print_usage()
+        return
+    
+    if args.assemble:
+        assemble_course(args.quality, args.output)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Course assembly by stream copy.
+
+Joins the rendered scene videos into one lecture file with ffmpeg's concat
+demuxer, copying the encoded streams instead of re-encoding them, and adds
+one chapter marker per scene. Inputs whose codec parameters differ from the
+rest are re-encoded on their own first so the copy stays valid.
+"""
+
+import json
+import subprocess
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from rendering.runner import video_dir
+
+
+# ffmpeg encoder to use when a mismatched input must match a reference codec
+ENCODERS = {"h264": "libx264", "hevc": "libx265", "vp9": "libvpx-vp9", "prores": "prores_ks", "qtrle": "qtrle"}
+
+
+def probe(path):
+    """Codec parameters and duration of the video at ``path``."""
+    cmd = [
+        "ffprobe", "-v", "error", "-print_format", "json",
+        "-show_entries", "stream=codec_type,codec_name,width,height,pix_fmt,r_frame_rate,time_base:format=duration",
+        str(path),
+    ]
+    info = json.loads(subprocess.run(cmd, capture_output=True, text=True, check=True).stdout)
+    video = next(stream for stream in info["streams"] if stream["codec_type"] == "video")
+    signature = (
+        video["codec_name"], video["width"], video["height"], video["pix_fmt"],
+        video["r_frame_rate"], video["time_base"],
+        any(stream["codec_type"] == "audio" for stream in info["streams"]),
+    )
+    return {"signature": signature, "duration": float(info["format"]["duration"])}
+
+
+def reencode_to_match(source, target, signature, has_audio):
+    """Re-encode ``source`` so its stream parameters equal ``signature``."""
+    codec, width, height, pix_fmt, frame_rate, time_base, wants_audio = signature
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", str(source)]
+    if wants_audio and not has_audio:
+        cmd += ["-f", "lavfi", "-i", "anullsrc=r=48000:cl=stereo", "-shortest"]
+    cmd += [
+        "-vf", f"scale={width}:{height},fps={frame_rate}",
+        "-c:v", ENCODERS.get(codec, codec), "-pix_fmt", pix_fmt,
+        "-video_track_timescale", time_base.split("/")[1],
+    ]
+    cmd += ["-c:a", "aac"] if wants_audio else ["-an"]
+    cmd.append(str(target))
+    subprocess.run(cmd, check=True)
+
+
+def escape_metadata(value):
+    for char in "\\=;#\n":
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def concat_stream_copy(inputs, output, chapters=None):
+    """Concatenate ``inputs`` into ``output`` without re-encoding.
+
+    ``chapters`` is an optional list of ``(title, start, end)`` in seconds.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        list_file = Path(tmp) / "inputs.txt"
+        list_file.write_text("".join(
+            "file '{}'\n".format(str(Path(path).resolve()).replace("'", "'\\''")) for path in inputs
+        ))
+        cmd = ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_file)]
+
+        if chapters:
+            metadata_file = Path(tmp) / "chapters.txt"
+            lines = [";FFMETADATA1"]
+            for title, start, end in chapters:
+                lines += [
+                    "[CHAPTER]", "TIMEBASE=1/1000",
+                    f"START={round(start * 1000)}", f"END={round(end * 1000)}",
+                    f"title={escape_metadata(title)}",
+                ]
+            metadata_file.write_text("\n".join(lines) + "\n")
+            cmd += ["-i", str(metadata_file), "-map", "0", "-map_metadata", "1", "-map_chapters", "1"]
+
+        cmd += ["-c", "copy", str(output)]
+        subprocess.run(cmd, check=True)
+    return output
+
+
+def assemble_course(animations, quality="m", output=None):
+    """Join the rendered ``(scene, description)`` videos into one chaptered file."""
+    source_dir = video_dir(quality)
+    output = Path(output) if output else Path("media") / "course" / f"simple_llms_course_{source_dir.name}.mp4"
+
+    videos = [(source_dir / f"{name}.mp4", description) for name, description in animations]
+    missing = [str(path) for path, _ in videos if not path.exists()]
+    if missing:
+        raise FileNotFoundError("Render these scenes first: " + ", ".join(missing))
+
+    probes = [probe(path) for path, _ in videos]
+    reference = Counter(p["signature"] for p in probes).most_common(1)[0][0]
+
+    inputs = []
+    chapters = []
+    start = 0.0
+    normalized_dir = output.parent / "normalized"
+    for (path, description), info in zip(videos, probes):
+        if info["signature"] != reference:
+            normalized_dir.mkdir(parents=True, exist_ok=True)
+            target = normalized_dir / path.name
+            print(f"   🔧 Re-encoding {path.name} to match the other scenes")
+            reencode_to_match(path, target, reference, has_audio=info["signature"][-1])
+            path = target
+            info = probe(target)
+        inputs.append(path)
+        chapters.append((description, start, start + info["duration"]))
+        start += info["duration"]
+
+    return concat_stream_copy(inputs, output, chapters)
@@ -0,0 +1,114 @@
+"""
+Golden-frame regression checks.
+
+Renders each scene at a small resolution with animations skipped, grabs the
+frame at the end of every ``play``/``wait`` and compares its difference hash
+(dHash) with the one stored in ``golden/<Scene>.json``. Frames whose hashes
+differ by more than a few bits are written to ``media/golden/<Scene>/`` for
+inspection. Scenes are checked in parallel worker processes.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+from rendering.runner import render_scene
+
+
+GOLDEN_DIR = Path(__file__).resolve().parent.parent / "golden"
+MISMATCH_DIR = Path("media") / "golden"
+# Small enough to render a scene in seconds, large enough to show layout changes
+RESOLUTION = (320, 180)
+HASH_SIZE = 16
+TOLERANCE = 12
+
+
+class GoldenFrameRenderer(CairoRenderer):
+    """Renderer that skips animations and keeps the frame left by each play."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, skip_animations=True, **kwargs)
+        self.frames = []
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.static_image = None
+        self.update_frame(scene)
+        section = self.file_writer.sections[-1].name if self.file_writer.sections else ""
+        self.frames.append((section, self.get_frame().copy()))
+
+
+def dhash(frame, hash_size=HASH_SIZE):
+    """Difference hash of an RGBA frame, as a hex string of ``hash_size ** 2`` bits."""
+    image = Image.fromarray(frame).convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+    pixels = np.asarray(image, dtype=np.int16)
+    return np.packbits(pixels[:, 1:] > pixels[:, :-1]).tobytes().hex()
+
+
+def hamming(hash_a, hash_b):
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+
+def render_frames(name):
+    """``(section, frame)`` at the end of every play of scene ``name``."""
+    width, height = RESOLUTION
+    scene = render_scene(
+        name,
+        "l",
+        renderer_class=GoldenFrameRenderer,
+        pixel_width=width,
+        pixel_height=height,
+        write_to_movie=False,
+        disable_caching=True
+    )
+    return scene.renderer.frames
+
+
+def golden_path(name):
+    return GOLDEN_DIR / f"{name}.json"
+
+
+def update_golden(name):
+    """Render scene ``name`` and store its frame hashes as the new golden set."""
+    frames = [{"section": section, "hash": dhash(frame)} for section, frame in render_frames(name)]
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    golden_path(name).write_text(json.dumps({"scene": name, "resolution": RESOLUTION, "frames": frames}, indent=1))
+    return {"scene": name, "frames": len(frames), "failures": []}
+
+
+def check_golden(name, tolerance=TOLERANCE):
+    """Compare scene ``name`` with its golden hashes; returns a report of failing frames."""
+    path = golden_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"No golden frames for {name}; run with --update-golden first")
+    golden = json.loads(path.read_text())["frames"]
+    frames = render_frames(name)
+
+    failures = []
+    if len(frames) != len(golden):
+        failures.append(f"{len(frames)} plays, golden has {len(golden)}")
+    for index, ((section, frame), expected) in enumerate(zip(frames, golden)):
+        distance = hamming(dhash(frame), expected["hash"])
+        if distance > tolerance:
+            out_dir = MISMATCH_DIR / name
+            out_dir.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(frame).save(out_dir / f"play_{index:03d}.png")
+            failures.append(f"play {index} ({section or expected['section']}) differs by {distance} bits")
+    return {"scene": name, "frames": len(frames), "failures": failures}
+
+
+def run_golden(names, update=False, tolerance=TOLERANCE, jobs=None):
+    """Check (or update) several scenes in parallel; yields a report or error per scene."""
+    task = update_golden if update else partial(check_golden, tolerance=tolerance)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(task, name): name for name in names}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
@@ -0,0 +1,110 @@
+"""
+Dry-run timeline planner.
+
+Runs each scene's ``construct`` with a renderer that never rasterizes or
+encodes: every ``play``/``wait`` jumps to its end state and is recorded with
+its run time and section. From that it reports durations, animation counts
+and a rough render cost, and compares them with the plan saved in
+``golden/plan.json`` to catch accidental timing changes.
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from manim import Wait, config
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from rendering.runner import render_scene
+
+
+PLAN_FILE = Path(__file__).resolve().parent.parent / "golden" / "plan.json"
+# Rough Cairo cost of one frame per million pixels, measured on a laptop core
+SECONDS_PER_MEGAPIXEL_FRAME = 0.015
+
+
+class PlanRenderer(CairoRenderer):
+    """Renderer that skips every frame and records the timeline instead."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, skip_animations=True, **kwargs)
+        self.timeline = []
+        # Read while the render's config is active; it reverts when render_scene returns
+        self.frame_rate = config.frame_rate
+        self.megapixels = self.camera.pixel_width * self.camera.pixel_height / 1e6
+
+    def play(self, scene, *args, **kwargs):
+        start = scene.time
+        super().play(scene, *args, **kwargs)
+        self.timeline.append({
+            "section": self.file_writer.sections[-1].name if self.file_writer.sections else "",
+            "kind": "wait" if all(isinstance(anim, Wait) for anim in scene.animations) else "play",
+            "run_time": round(scene.time - start, 3),
+        })
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        return None
+
+
+def plan_scene(name, quality="m"):
+    """Timeline summary of scene ``name`` without rendering any frames."""
+    scene = render_scene(name, quality, renderer_class=PlanRenderer, write_to_movie=False, disable_caching=True)
+    renderer = scene.renderer
+    timeline = renderer.timeline
+
+    sections = defaultdict(lambda: {"duration": 0.0, "plays": 0, "waits": 0})
+    for entry in timeline:
+        section = sections[entry["section"]]
+        section["duration"] = round(section["duration"] + entry["run_time"], 3)
+        section["plays" if entry["kind"] == "play" else "waits"] += 1
+
+    duration = round(sum(entry["run_time"] for entry in timeline), 3)
+    frames = round(duration * renderer.frame_rate)
+    return {
+        "duration": duration,
+        "plays": sum(section["plays"] for section in sections.values()),
+        "waits": sum(section["waits"] for section in sections.values()),
+        "frames": frames,
+        "render_seconds": round(frames * renderer.megapixels * SECONDS_PER_MEGAPIXEL_FRAME),
+        "sections": dict(sections),
+    }
+
+
+def plan_suite(names, quality="m"):
+    return {name: plan_scene(name, quality) for name in names}
+
+
+def load_plan():
+    return json.loads(PLAN_FILE.read_text()) if PLAN_FILE.exists() else None
+
+
+def save_plan(plans):
+    PLAN_FILE.parent.mkdir(exist_ok=True)
+    PLAN_FILE.write_text(json.dumps(
+        {name: {"duration": plan["duration"], "plays": plan["plays"], "waits": plan["waits"],
+                "sections": plan["sections"]} for name, plan in plans.items()},
+        indent=1
+    ))
+    return PLAN_FILE
+
+
+def plan_changes(plans, saved, tolerance=0.01):
+    """Human-readable differences between ``plans`` and a saved plan."""
+    changes = []
+    for name, plan in plans.items():
+        if name not in saved:
+            continue
+        before = saved[name]
+        for key in ("plays", "waits"):
+            if plan[key] != before[key]:
+                changes.append(f"{name}: {before[key]} → {plan[key]} {key}")
+        for section, now in plan["sections"].items():
+            was = before["sections"].get(section, {}).get("duration", 0.0)
+            if abs(now["duration"] - was) > tolerance:
+                changes.append(f"{name} / {section}: {was:.2f}s → {now['duration']:.2f}s")
+        for section in before["sections"].keys() - plan["sections"].keys():
+            changes.append(f"{name} / {section}: section removed")
+    return changes
@@ -0,0 +1,58 @@
+"""
+In-process scene rendering shared by the render modes in ``main.py``.
+
+``manim main.py <Scene>`` can only pick a quality, while several render modes
+need their own renderer or file writer, so they build the scene here under a
+temporary manim config instead of shelling out to the CLI.
+"""
+
+import importlib
+from pathlib import Path
+
+from manim import config, tempconfig
+from manim.constants import QUALITIES as MANIM_QUALITIES
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+MAIN_FILE = Path(__file__).resolve().parent.parent / "main.py"
+
+# Same letters as ``manim -q``
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def video_dir(quality="m", media_dir="media"):
+    """Directory where ``manim -q <quality> main.py`` writes its movies."""
+    settings = MANIM_QUALITIES[QUALITIES[quality]]
+    return Path(media_dir) / "videos" / MAIN_FILE.stem / f"{settings['pixel_height']}p{settings['frame_rate']}"
+
+
+def load_scene(name):
+    """Look up a scene class by name among the scenes ``main.py`` imports."""
+    return getattr(importlib.import_module("main"), name)
+
+
+def render_scene(name, quality="m", file_writer_class=SceneFileWriter, renderer_class=CairoRenderer,
+                 prepare=None, **options):
+    """Render scene ``name`` in this process and return the finished scene.
+
+    ``options`` are manim config values (e.g. ``disable_caching=True``) that
+    only apply to this render, and ``prepare`` is called with the scene just
+    before it renders. Output lands where ``manim main.py`` puts it.
+    """
+    with tempconfig({}):
+        config.input_file = str(MAIN_FILE)
+        config.quality = QUALITIES[quality]
+        for key, value in options.items():
+            setattr(config, key, value)
+        scene = load_scene(name)(renderer=renderer_class(file_writer_class=file_writer_class))
+        if prepare is not None:
+            prepare(scene)
+        scene.render()
+    return scene
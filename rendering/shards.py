@@ -0,0 +1,145 @@
+"""
+Intra-scene sharding: render the sections of one long scene in parallel.
+
+Every ``self.phase(...)`` starts a manim section. A dry run (the planner's
+renderer) lists a scene's sections and their durations from its timeline,
+then each section is rendered by its own worker process: the worker runs
+``construct`` from the start with every earlier section skipped, so the
+scene reaches the section's starting state without drawing a frame, renders
+that section, and stops at the next one. The section movies share codec settings and are
+joined with ``concat_stream_copy``, without re-encoding, into the scene's
+usual output file with a chapter per section.
+
+Skipped plays jump to their end state in one step, so updaters that
+integrate ``dt`` see one large step instead of many small ones; the scenes
+here drive their updaters from ``ValueTracker`` values instead.
+"""
+
+import inspect
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.exceptions import EndSceneEarlyException
+
+from rendering.assembly import concat_stream_copy, probe
+from rendering.plan import PlanRenderer
+from rendering.runner import render_scene, video_dir
+
+
+# Name of the section manim's file writer opens before ``construct`` runs
+AUTOCREATED_SECTION = "autocreated"
+
+
+class SectionFileWriter(SceneFileWriter):
+    """File writer that keeps section number ``section`` and skips the others.
+
+    Sections are numbered in the order they are started, the autocreated one
+    being 0, whether or not manim later drops them for being empty.
+    """
+
+    section = 0
+
+    def __init__(self, *args, **kwargs):
+        self.sections_started = 0
+        super().__init__(*args, **kwargs)
+
+    def next_section(self, *args, **kwargs):
+        index = self.sections_started
+        self.sections_started += 1
+        if index > self.section:
+            # Nothing after this worker's section needs to run
+            raise EndSceneEarlyException()
+        # The section type parameter is ``type`` before manim 0.19 and ``type_`` from it
+        arguments = inspect.signature(super().next_section).bind(*args, **kwargs).arguments
+        arguments["skip_animations"] = arguments["skip_animations"] or index != self.section
+        super().next_section(**arguments)
+
+
+class SectionRenderer(CairoRenderer):
+    """Renderer that draws nothing while fast-forwarding through skipped sections."""
+
+    def update_frame(self, *args, **kwargs):
+        if not self.skip_animations:
+            super().update_frame(*args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if self.skip_animations:
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+
+def section_file(name, index):
+    return f"{name}_section{index:02d}"
+
+
+def list_sections(name, quality="m"):
+    """``(section name, duration)`` of every section of scene ``name``, from a dry run.
+
+    The list is indexed like ``SectionFileWriter`` numbers sections, so it
+    always starts with the autocreated section, empty if the first phase
+    opens before any play.
+    """
+    scene = render_scene(name, quality, renderer_class=PlanRenderer, write_to_movie=False, disable_caching=True)
+    # Without movie output every section is empty, so the file writer only
+    # keeps the last one; the timeline has them all, in playing order
+    sections = [[AUTOCREATED_SECTION, 0.0]]
+    previous = AUTOCREATED_SECTION
+    for entry in scene.renderer.timeline:
+        if entry["section"] != previous:
+            sections.append([entry["section"], 0.0])
+            previous = entry["section"]
+        sections[-1][1] += entry["run_time"]
+    return [(section, round(duration, 3)) for section, duration in sections]
+
+
+def render_section(name, index, quality="m"):
+    """Render section ``index`` of scene ``name`` alone; returns its movie, or None if it has no plays."""
+    writer_class = type("SectionFileWriter", (SectionFileWriter,), {"section": index})
+    scene = render_scene(
+        name,
+        quality,
+        file_writer_class=writer_class,
+        renderer_class=SectionRenderer,
+        output_file=section_file(name, index),
+        partial_movie_dir=str(video_dir(quality) / "partial_movie_files" / section_file(name, index)),
+        save_sections=False
+    )
+    writer = scene.renderer.file_writer
+    if not any(writer.partial_movie_files):
+        return None
+    return writer.movie_file_path
+
+
+def render_sections(name, sections, quality="m", jobs=None):
+    """Render the ``sections`` of scene ``name`` in parallel; yields ``(index, path or error)``."""
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Longest sections first, so the slowest one is never started last
+        order = sorted(range(len(sections)), key=lambda index: -sections[index][1])
+        futures = {}
+        for index in order:
+            if sections[index][1] > 0:
+                futures[pool.submit(render_section, name, index, quality)] = index
+            else:
+                # Nothing is played in it, so there is no movie to render
+                yield index, None
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
+
+
+def join_sections(name, sections, movies, quality="m"):
+    """Stream-copy the section ``movies`` (by index) into ``<name>.mp4`` with a chapter per section."""
+    inputs = []
+    chapters = []
+    start = 0.0
+    for index, (section, _) in enumerate(sections):
+        if movies.get(index) is None:
+            continue
+        duration = probe(movies[index])["duration"]
+        inputs.append(movies[index])
+        chapters.append((section, start, start + duration))
+        start += duration
+    return concat_stream_copy(inputs, video_dir(quality) / f"{name}.mp4", chapters)
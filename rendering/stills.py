@@ -0,0 +1,98 @@
+"""
+Still-frame export for slides and handouts.
+
+Runs scenes with every animation skipped, so each play jumps straight to its
+end state, and saves the frame on screen at the end of each phase (see
+``PhaseLifecycleMixin.phase_finished``) plus the final frame of the scene.
+Scenes without ``PhaseLifecycleMixin`` (WeightVisualization, RNNProblems,
+TransformerArchitecture, LLMCapabilities, ...) have no phases, so they only
+produce the "final" still.
+Scenes are exported in parallel worker processes.
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+from rendering.runner import render_scene
+from rendering.svg import svg_document
+
+
+STILLS_DIR = Path("media") / "stills"
+FINAL_STILL = "final"
+
+
+def slug(name):
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")
+
+
+def save_still(scene, path_stem, formats):
+    """Write what ``scene`` shows right now as ``<path_stem>.png``/``.svg``."""
+    paths = []
+    if "png" in formats:
+        renderer = scene.renderer
+        renderer.static_image = None
+        renderer.update_frame(scene, ignore_skipping=True)
+        path = path_stem.with_suffix(".png")
+        Image.fromarray(renderer.get_frame()).save(path)
+        paths.append(path)
+    if "svg" in formats:
+        path = path_stem.with_suffix(".svg")
+        path.write_text(svg_document(list(getattr(scene, "static_layer", [])) + scene.mobjects))
+        paths.append(path)
+    return paths
+
+
+def export_stills(name, quality="h", sections=None, formats=("png",)):
+    """Export the end-of-phase stills of scene ``name`` and return their paths.
+
+    ``sections`` limits the export to the named phases; ``"final"`` stands for
+    the last frame of the scene.
+    """
+    out_dir = STILLS_DIR / name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def wanted(label):
+        return sections is None or label in sections
+
+    def capture(scene, label):
+        if wanted(label):
+            stem = out_dir / f"{len(written):02d}_{slug(label)}"
+            written.extend(save_still(scene, stem, formats))
+
+    def prepare(scene):
+        scene.phase_finished = partial(capture, scene)
+        tear_down = scene.tear_down
+
+        def finish():
+            # Still inside the render's config, so frame size and background match the quality
+            capture(scene, FINAL_STILL)
+            tear_down()
+
+        scene.tear_down = finish
+
+    render_scene(
+        name,
+        quality,
+        renderer_class=partial(CairoRenderer, skip_animations=True),
+        prepare=prepare,
+        write_to_movie=False,
+        disable_caching=True
+    )
+    return written
+
+
+def export_all_stills(names, quality="h", sections=None, formats=("png",), jobs=None):
+    """Export stills for several scenes in parallel; yields ``(name, paths or error)``."""
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(export_stills, name, quality, sections, formats): name for name in names}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
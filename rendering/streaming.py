@@ -0,0 +1,256 @@
+"""
+Single-pass streaming encode.
+
+The stock file writer encodes every ``play``/``wait`` into its own partial
+movie file and concatenates them when the scene ends. ``StreamingFileWriter``
+instead keeps one ffmpeg process open for the whole scene (or for each
+section) and writes the final file directly.
+
+Frames go through a ring of preallocated buffers sized from a byte budget,
+so memory stays flat however long the scene is and whatever the resolution,
+and ``max_rss`` stops a render that grows past a resident memory ceiling.
+"""
+
+import os
+import queue
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from manim import config
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+from rendering.runner import render_scene
+
+
+# Memory for queued frames: 7 slots at 1080p, 2 at 4K
+FRAME_BUFFER_BYTES = 64 * 1024 ** 2
+RSS_CHECK_INTERVAL = 24
+
+
+def resident_memory():
+    """Resident set size of this process in bytes, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class FrameEncoder:
+    """ffmpeg process fed by a writer thread from a ring of preallocated frames.
+
+    ``write`` copies the frame into a free slot and blocks while none is
+    free, so a slow encoder holds back the renderer instead of letting frames
+    pile up in memory.
+    """
+
+    def __init__(self, path, width, height, frame_rate, queue_size=8):
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-s", f"{width}x{height}", "-pix_fmt", "rgba",
+            "-r", str(frame_rate), "-i", "-", "-an",
+        ]
+        if config.transparent:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        command.append(str(path))
+
+        self.path = path
+        self.error = None
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.slots = np.empty((queue_size, height, width, 4), dtype=np.uint8)
+        self.free = queue.Queue()
+        for slot in range(queue_size):
+            self.free.put(slot)
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._drain, daemon=True)
+        self.thread.start()
+
+    def write(self, frame, num_frames=1):
+        if self.error is not None:
+            raise RuntimeError(f"Encoder for {self.path} failed") from self.error
+        slot = self.free.get()
+        np.copyto(self.slots[slot], frame)
+        self.queue.put((slot, num_frames))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.process.stdin.close()
+        if self.process.wait() != 0 or self.error is not None:
+            raise RuntimeError(f"ffmpeg could not write {self.path}") from self.error
+
+    def abort(self):
+        """Kill ffmpeg without finishing the file and delete what it wrote."""
+        self.process.kill()
+        self.queue.put(None)
+        self.thread.join()
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass  # The pipe is already broken
+        self.process.wait()
+        self.path.unlink(missing_ok=True)
+
+    def _drain(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            slot, num_frames = item
+            if self.error is None:
+                try:
+                    for _ in range(num_frames):
+                        self.process.stdin.write(self.slots[slot])
+                except OSError as error:
+                    self.error = error
+            # Hand the slot back even after a failure so writers never block on a dead encoder
+            self.free.put(slot)
+
+
+class PixelArrayRenderer(CairoRenderer):
+    """Cairo renderer that passes the camera's pixel array to the file writer.
+
+    ``CairoRenderer.render`` hands over ``get_frame()``, a full copy of the
+    frame; the streaming writer copies into its own buffers anyway, so the
+    extra per-frame allocation is skipped.
+    """
+
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+
+class StreamingFileWriter(SceneFileWriter):
+    """Scene file writer that streams all frames into one encoder.
+
+    With ``split_sections`` set, a new encoder is started for every section
+    and each section is written next to the movie as
+    ``<Scene>_<index>_<section>.mp4``.
+    """
+
+    split_sections = False
+    buffer_bytes = FRAME_BUFFER_BYTES
+    max_rss = None
+
+    def __init__(self, *args, **kwargs):
+        self.encoder = None
+        self.section_files = []
+        self.frames_written = 0
+        super().__init__(*args, **kwargs)
+
+    def next_section(self, *args, **kwargs):
+        # manim 0.18 passes the section type as ``type=``, 0.19 as ``type_=``
+        super().next_section(*args, **kwargs)
+        if self.split_sections:
+            self.close_encoder()
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and self.encoder is None:
+            self.encoder = self.open_encoder()
+
+    def end_animation(self, allow_write=False):
+        # The encoder stays open across animations
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self.encoder is None:
+            # manim 0.18's write_frame takes a single frame
+            for _ in range(num_frames):
+                super().write_frame(frame_or_renderer)
+            return
+        if isinstance(frame_or_renderer, np.ndarray):
+            frame = frame_or_renderer
+        else:
+            frame = frame_or_renderer.camera.pixel_array
+        self.encoder.write(frame, num_frames)
+        self.frames_written += 1
+        if self.max_rss is not None and self.frames_written % RSS_CHECK_INTERVAL == 0:
+            self.check_memory()
+
+    def check_memory(self):
+        rss = resident_memory()
+        if rss is not None and rss > self.max_rss:
+            raise MemoryError(
+                f"Rendering {self.movie_file_path.name} uses {rss / 1024 ** 2:.0f} MB, "
+                f"over the {self.max_rss / 1024 ** 2:.0f} MB ceiling"
+            )
+
+    def combine_to_movie(self):
+        self.close_encoder()
+
+    def open_encoder(self):
+        path = self.movie_file_path
+        if self.split_sections:
+            index = len(self.sections) - 1
+            name = self.sections[-1].name.replace(" ", "_")
+            path = path.with_name(f"{path.stem}_{index:04d}_{name}{path.suffix}")
+            self.section_files.append(path)
+        frame_bytes = config.pixel_width * config.pixel_height * 4
+        return FrameEncoder(
+            path,
+            config.pixel_width,
+            config.pixel_height,
+            config.frame_rate,
+            queue_size=max(2, self.buffer_bytes // frame_bytes)
+        )
+
+    def close_encoder(self):
+        if self.encoder is not None:
+            self.encoder.close()
+            self.encoder = None
+
+    def abort_encoder(self):
+        if self.encoder is not None:
+            self.encoder.abort()
+            self.encoder = None
+
+
+def render_streaming(name, quality="m", split_sections=False, max_rss_mb=None):
+    """Render scene ``name`` through streaming encoders and return the written files.
+
+    ``max_rss_mb`` aborts the render with ``MemoryError`` once this process's
+    resident memory goes over that many MB.
+    """
+    writer_class = type("StreamingFileWriter", (StreamingFileWriter,), {
+        "split_sections": split_sections,
+        "max_rss": max_rss_mb * 1024 ** 2 if max_rss_mb else None,
+    })
+    writers = []
+    try:
+        # Partial-movie caching has nothing to reuse when no partial files exist
+        render_scene(
+            name,
+            quality,
+            file_writer_class=writer_class,
+            renderer_class=PixelArrayRenderer,
+            prepare=lambda scene: writers.append(scene.renderer.file_writer),
+            disable_caching=True,
+            save_sections=False
+        )
+    finally:
+        # A failed render (e.g. over max_rss) must not leave ffmpeg running
+        for writer in writers:
+            writer.abort_encoder()
+    writer = writers[0]
+    return writer.section_files if split_sections else [writer.movie_file_path]
+
+
+def render_streaming_all(names, quality="m", max_rss_mb=None, jobs=None):
+    """Stream-render several scenes in parallel processes; yields ``(name, paths or error)``.
+
+    Each worker enforces ``max_rss_mb`` on its own, so ``jobs * max_rss_mb``
+    bounds the memory of the whole batch.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(render_streaming, name, quality, False, max_rss_mb): name for name in names}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
@@ -0,0 +1,94 @@
+"""
+SVG export of mobjects.
+
+Writes each VMobject's cubic Bézier subpaths as an SVG path with its fill
+and stroke, and point clouds as small circles, in manim frame coordinates
+with the y axis flipped. Used for slide stills and the web export.
+"""
+
+import numpy as np
+from manim import PMobject, VMobject, config
+from manim.utils.color import color_to_rgba
+from manim.utils.family import extract_mobject_family_members
+
+
+# manim stroke widths are in units of 1/100 of a frame unit (see Camera.cairo_line_width_multiple)
+STROKE_WIDTH_SCALE = 0.01
+
+
+def css_color(rgba):
+    r, g, b = (np.clip(rgba[:3], 0, 1) * 255).round().astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def path_data(mob):
+    parts = []
+    for subpath in mob.get_subpaths():
+        if len(subpath) < 4:
+            continue
+        parts.append(f"M{subpath[0][0]:.4f} {subpath[0][1]:.4f}")
+        for h1, h2, anchor in zip(subpath[1::4], subpath[2::4], subpath[3::4]):
+            parts.append(
+                f"C{h1[0]:.4f} {h1[1]:.4f} {h2[0]:.4f} {h2[1]:.4f} {anchor[0]:.4f} {anchor[1]:.4f}"
+            )
+        if np.allclose(subpath[0], subpath[-1]):
+            parts.append("Z")
+    return "".join(parts)
+
+
+def vmobject_element(mob):
+    data = path_data(mob)
+    if not data:
+        return ""
+    fill = mob.get_fill_rgbas()[0]
+    stroke = mob.get_stroke_rgbas()[0]
+    stroke_width = mob.get_stroke_width() * STROKE_WIDTH_SCALE
+    attributes = [f'd="{data}"']
+    if fill[3] > 0:
+        attributes.append(f'fill="{css_color(fill)}" fill-opacity="{fill[3]:.3f}"')
+    else:
+        attributes.append('fill="none"')
+    if stroke[3] > 0 and stroke_width > 0:
+        attributes.append(
+            f'stroke="{css_color(stroke)}" stroke-opacity="{stroke[3]:.3f}" '
+            f'stroke-width="{stroke_width:.4f}" stroke-linejoin="round" stroke-linecap="round"'
+        )
+    return f"<path {' '.join(attributes)}/>"
+
+
+def point_cloud_element(mob):
+    # Point thickness is in pixels
+    radius = mob.stroke_width * config.frame_width / config.pixel_width / 2
+    circles = [
+        f'<circle cx="{x:.4f}" cy="{y:.4f}" r="{radius:.4f}" fill="{css_color(rgba)}" fill-opacity="{rgba[3]:.3f}"/>'
+        for (x, y, _), rgba in zip(mob.points, mob.rgbas)
+    ]
+    return "".join(circles)
+
+
+def mobject_elements(mobjects):
+    """SVG elements for ``mobjects`` and their families, in drawing order."""
+    elements = []
+    for mob in extract_mobject_family_members(mobjects, use_z_index=True, only_those_with_points=True):
+        if isinstance(mob, VMobject):
+            elements.append(vmobject_element(mob))
+        elif isinstance(mob, PMobject):
+            elements.append(point_cloud_element(mob))
+    return "".join(elements)
+
+
+def svg_document(mobjects, background=None, transparent=False):
+    """A standalone SVG of ``mobjects`` framed like the camera frame.
+
+    With ``transparent`` the background is left out, so documents can be layered.
+    """
+    width, height = config.frame_width, config.frame_height
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{-width / 2:.4f} {-height / 2:.4f} {width:.4f} {height:.4f}" '
+        f'width="{config.pixel_width}" height="{config.pixel_height}">'
+    ]
+    if not transparent:
+        fill = css_color(color_to_rgba(background or config.background_color))
+        parts.append(f'<rect x="{-width / 2:.4f}" y="{-height / 2:.4f}" width="{width:.4f}" height="{height:.4f}" fill="{fill}"/>')
+    parts.append(f'<g transform="scale(1,-1)">{mobject_elements(mobjects)}</g></svg>')
+    return "".join(parts)
@@ -0,0 +1,231 @@
+"""
+Localized variants of a scene.
+
+Renders the base locale first, then every other locale in parallel worker
+processes. Each variant writes ``<name>_<locale>.mp4`` (the base locale keeps
+the plain name) and gets its own partial movie directory, seeded with hard
+links to the base render's cached segments, so workers never share or clean
+each other's cache.
+
+Every scene keeps translated text on screen, and manim's segment hash covers
+every mobject on screen, so on their own no two locales would share a
+segment. Plays that leave all text untouched are therefore rendered without
+it: their text is kept out of the hashed scene state and the frames, and is
+laid over the cached segment afterwards as an image of that locale's
+strings. Those segments are rendered once, by the base locale, and a new
+language only re-encodes them with its own text; plays that animate text,
+or draw over it, are rendered for every locale. Text in a scene's static
+layer is baked into the background, so plays during it are rendered for
+every locale as well.
+
+The overlay is checked against the mobjects on screen when each play
+starts: something moving over a label in the middle of a play is drawn
+under it in the variants.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+from manim import MarkupText, Mobject, Text
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from PIL import Image
+
+from animations.glyph_label import GlyphLabel
+from animations.i18n import DEFAULT_LOCALE, LOCALE_ENV
+from rendering.assembly import ENCODERS, probe
+from rendering.runner import render_scene, video_dir
+
+
+# Mobjects whose shapes come from a string table
+TEXT_TYPES = (Text, MarkupText, GlyphLabel)
+# Seeded segments must outlive manim's default cap of 100 cached files
+MAX_FILES_CACHED = 100_000
+
+
+def variant_name(name, locale):
+    return name if locale == DEFAULT_LOCALE else f"{name}_{locale}"
+
+
+def partial_movie_dir(name, locale, quality):
+    return video_dir(quality) / "partial_movie_files" / variant_name(name, locale)
+
+
+def text_layer_dir(name, locale, quality):
+    # Outside the partial movie directory, which manim's cache cleanup expects to hold only segments
+    return video_dir(quality) / "text_layers" / variant_name(name, locale)
+
+
+def has_text(mob):
+    return any(isinstance(member, TEXT_TYPES) for member in mob.get_family())
+
+
+def overlaps(mob, other):
+    if not mob.family_members_with_points() or not other.family_members_with_points():
+        return False
+    return all(
+        abs(mob.get_coord(dim) - other.get_coord(dim)) <= (mob.length_over_dim(dim) + other.length_over_dim(dim)) / 2
+        for dim in (0, 1)
+    )
+
+
+def text_layer(scene, animations):
+    """The top-level mobjects holding text, if the play of ``animations`` leaves them untouched, else None."""
+    if any(has_text(mob) for mob in getattr(scene, "static_layer", [])):
+        return None
+    texts = [mob for mob in scene.mobjects if has_text(mob)]
+    if not texts:
+        return None
+
+    animated = []
+    for animation in animations:
+        for attr in ("mobject", "target_mobject"):
+            mob = getattr(animation, attr, None)
+            if isinstance(mob, Mobject):
+                animated.append(mob)
+    animated_ids = {id(member) for mob in animated for member in mob.get_family()}
+    for mob in texts:
+        if mob.get_family_updaters() or any(id(member) in animated_ids for member in mob.get_family()):
+            return None
+
+    # The text is laid over the whole segment, so nothing may be drawn over it
+    for index, mob in enumerate(scene.mobjects):
+        if mob in texts:
+            above = [other for other in scene.mobjects[index + 1:] if other not in texts] + animated
+            if any(overlaps(mob, other) for other in above):
+                return None
+    return texts
+
+
+def overlay_image(source, image, target):
+    """Re-encode the video ``source`` with ``image`` laid over every frame, keeping its stream parameters."""
+    codec, _, _, pix_fmt, _, time_base, _ = probe(source)["signature"]
+    subprocess.run([
+        "ffmpeg", "-y", "-loglevel", "error", "-i", str(source), "-i", str(image),
+        "-filter_complex", "overlay",
+        "-c:v", ENCODERS.get(codec, codec), "-pix_fmt", pix_fmt,
+        "-video_track_timescale", time_base.split("/")[1],
+        "-an", str(target),
+    ], check=True)
+
+
+class TextLayerFileWriter(SceneFileWriter):
+    """File writer that lays each locale's text over the segments rendered without it."""
+
+    layer_dir = None
+
+    def __init__(self, *args, **kwargs):
+        # Index in ``partial_movie_files`` -> image of the text to lay over it
+        self.text_layers = {}
+        super().__init__(*args, **kwargs)
+
+    def add_text_layer(self, index, pixels):
+        self.layer_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.blake2b(pixels.tobytes(), digest_size=8).hexdigest()
+        image = self.layer_dir / f"text_{digest}.png"
+        if not image.exists():
+            # Cairo leaves colours premultiplied by alpha
+            rgb = pixels[..., :3].astype(np.float32)
+            alpha = pixels[..., 3:].astype(np.float32)
+            np.divide(rgb * 255, alpha, out=rgb, where=alpha > 0)
+            straight = np.concatenate([rgb.clip(0, 255), alpha], axis=-1).astype(np.uint8)
+            Image.fromarray(straight, "RGBA").save(image)
+        self.text_layers[index] = image
+
+    def combine_to_movie(self):
+        for index, image in self.text_layers.items():
+            source = Path(self.partial_movie_files[index])
+            target = self.layer_dir.resolve() / f"{source.stem}_{image.stem}{source.suffix}"
+            if not target.exists():
+                overlay_image(source, image, target)
+            self.partial_movie_files[index] = str(target)
+        super().combine_to_movie()
+
+
+class TextLayerRenderer(CairoRenderer):
+    """Renderer that leaves untouched text out of the play's hash and frames."""
+
+    def play(self, scene, *args, **kwargs):
+        texts = text_layer(scene, args)
+        if texts is None:
+            return super().play(scene, *args, **kwargs)
+
+        before = scene.mobjects
+        plays = len(self.file_writer.partial_movie_files)
+        scene.mobjects = [mob for mob in before if mob not in texts]
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            # Put the text back in its drawing order; whatever the play added stays on top
+            after = scene.mobjects
+            scene.mobjects = [mob for mob in before if mob in texts or mob in after]
+            scene.mobjects += [mob for mob in after if mob not in before]
+
+        files = self.file_writer.partial_movie_files
+        if len(files) > plays and files[-1] is not None:
+            self.file_writer.add_text_layer(len(files) - 1, self.capture_text(texts))
+
+    def capture_text(self, texts):
+        """RGBA pixels of ``texts`` alone on a transparent frame."""
+        camera = self.camera
+        frame = camera.pixel_array.copy()
+        camera.set_pixel_array(np.zeros_like(frame))
+        camera.capture_mobjects(texts)
+        pixels = camera.pixel_array.copy()
+        camera.set_pixel_array(frame)
+        return pixels
+
+
+def render_locale(name, locale, quality="m"):
+    """Render scene ``name`` with ``locale``'s strings to ``<name>_<locale>.mp4``."""
+    os.environ[LOCALE_ENV] = locale
+    writer_class = type("TextLayerFileWriter", (TextLayerFileWriter,), {
+        "layer_dir": text_layer_dir(name, locale, quality),
+    })
+    render_scene(
+        name,
+        quality,
+        file_writer_class=writer_class,
+        renderer_class=TextLayerRenderer,
+        output_file=variant_name(name, locale),
+        partial_movie_dir=str(partial_movie_dir(name, locale, quality)),
+        max_files_cached=MAX_FILES_CACHED
+    )
+    return video_dir(quality) / f"{variant_name(name, locale)}.mp4"
+
+
+def seed_cache(source, target):
+    """Hard-link (or copy) the cached segments in ``source`` into ``target``."""
+    target.mkdir(parents=True, exist_ok=True)
+    for segment in source.glob("*.mp4"):
+        destination = target / segment.name
+        if destination.exists():
+            continue
+        try:
+            os.link(segment, destination)
+        except OSError:
+            shutil.copy2(segment, destination)
+
+
+def render_variants(name, locales, quality="m", jobs=None):
+    """Render ``name`` in every locale, the first one before the rest; yields ``(locale, path or error)``."""
+    base, others = locales[0], locales[1:]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # The other locales reuse the text-free segments of this render
+        yield base, pool.submit(render_locale, name, base, quality).result()
+
+        source = partial_movie_dir(name, base, quality)
+        for locale in others:
+            seed_cache(source, partial_movie_dir(name, locale, quality))
+
+        futures = {pool.submit(render_locale, name, locale, quality): locale for locale in others}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as error:
+                yield futures[future], error
@@ -0,0 +1,160 @@
+"""
+Watch mode.
+
+Polls ``animations/*.py`` and the string tables in ``animations/locales/``
+and, once a burst of saves has settled, re-renders at preview quality only
+the scenes defined in the changed files or in modules that import them (a
+string table counts as part of ``animations.i18n``). A render still running when a newer edit lands is cancelled
+and its scenes are queued again with the new ones.
+"""
+
+import ast
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+ANIMATIONS_DIR = ROOT / "animations"
+LOCALES_DIR = ANIMATIONS_DIR / "locales"
+I18N_MODULE = "animations.i18n"
+MAIN_FILE = ROOT / "main.py"
+
+
+def module_name(path):
+    if path.suffix == ".json":
+        # Scenes read the string tables through the i18n module
+        return I18N_MODULE
+    return f"{path.parent.name}.{path.stem}"
+
+
+def scene_classes(tree):
+    """Classes in a module that define ``construct`` or derive from one that does."""
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    scenes = {
+        node.name for node in classes
+        if any(isinstance(item, ast.FunctionDef) and item.name == "construct" for item in node.body)
+    }
+    grew = True
+    while grew:
+        grew = False
+        for node in classes:
+            bases = {base.id for base in node.bases if isinstance(base, ast.Name)}
+            if node.name not in scenes and bases & scenes:
+                scenes.add(node.name)
+                grew = True
+    return scenes
+
+
+def imported_modules(tree):
+    """Modules a module imports, by dotted name."""
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+    return modules
+
+
+def exported_scenes():
+    """Scene names ``main.py`` imports, i.e. the ones ``manim main.py`` can render."""
+    tree = ast.parse(MAIN_FILE.read_text(encoding="utf-8"))
+    return {
+        alias.asname or alias.name
+        for node in tree.body if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+
+def affected_scenes(changed_files):
+    """Scenes to re-render after ``changed_files`` were edited, in file order."""
+    trees = {}
+    for path in sorted(ANIMATIONS_DIR.glob("*.py")):
+        try:
+            trees[module_name(path)] = ast.parse(path.read_text(encoding="utf-8"))
+        except SyntaxError as error:
+            print(f"   ⚠️  Skipping {path.name}: {error}")
+
+    # Follow imports backwards so a helper module edit reaches every scene using it
+    dirty = {module_name(Path(path)) for path in changed_files}
+    grew = True
+    while grew:
+        grew = False
+        for name, tree in trees.items():
+            if name not in dirty and imported_modules(tree) & dirty:
+                dirty.add(name)
+                grew = True
+
+    renderable = exported_scenes()
+    scenes = []
+    for name in sorted(dirty & trees.keys()):
+        scenes.extend(sorted(scene_classes(trees[name]) & renderable))
+    return scenes
+
+
+def snapshot():
+    paths = [*ANIMATIONS_DIR.glob("*.py"), *LOCALES_DIR.glob("*.json")]
+    return {path: path.stat().st_mtime_ns for path in paths}
+
+
+def start_render(scenes, quality):
+    print(f"\n🔁 Re-rendering {', '.join(scenes)}")
+    return subprocess.Popen(
+        ["manim", "-q", quality, str(MAIN_FILE), *scenes],
+        cwd=ROOT,
+        start_new_session=os.name == "posix"
+    )
+
+
+def cancel_render(process):
+    # Stop the whole process group so ffmpeg children go down with manim
+    if os.name == "posix":
+        os.killpg(process.pid, signal.SIGTERM)
+    else:
+        process.terminate()
+    process.wait()
+
+
+def watch(quality="l", debounce=0.5, interval=0.2):
+    """Watch ``animations/`` and re-render affected scenes until interrupted."""
+    print(f"👀 Watching {ANIMATIONS_DIR} (Ctrl+C to stop)")
+    mtimes = snapshot()
+    pending = set()
+    last_change = 0.0
+    process = None
+    rendering = set()
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            changed = {path for path in current.keys() | mtimes.keys() if current.get(path) != mtimes.get(path)}
+            mtimes = current
+
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+                if process is not None and process.poll() is None:
+                    print("   ⏹️  Newer edit landed, cancelling the running render")
+                    cancel_render(process)
+                    pending |= rendering
+                    process = None
+
+            if process is not None and process.poll() is not None:
+                status = "✅ Rendered" if process.returncode == 0 else "❌ Failed to render"
+                print(f"   {status} in {time.monotonic() - started:.1f}s")
+                process = None
+
+            if pending and process is None and time.monotonic() - last_change >= debounce:
+                scenes = affected_scenes(pending)
+                rendering, pending = pending, set()
+                if scenes:
+                    started = time.monotonic()
+                    process = start_render(scenes, quality)
+    except KeyboardInterrupt:
+        if process is not None and process.poll() is None:
+            cancel_render(process)
+        print("\n👋 Stopped watching")
@@ -0,0 +1,105 @@
+"""
+Web export: a JSON timeline plus SVG assets instead of a video.
+
+Runs a scene with animations skipped and records, at the end of every play,
+which top-level mobjects are on screen. Each mobject's state is written once
+as a transparent SVG under ``assets/`` and named by a hash of its content, so
+objects that stay put across plays (titles, static diagrams) are shared by
+every keyframe that shows them. Each keyframe also keeps its play's run
+time and rate function, and ``player.html`` stacks the assets of each
+keyframe and cross-fades to it over that run time with the matching easing.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+from manim import ManimColor, linear
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from rendering.runner import render_scene
+from rendering.svg import svg_document
+
+
+WEB_DIR = Path("media") / "web"
+PLAYER = Path(__file__).resolve().parent / "player.html"
+
+
+class TimelineRenderer(CairoRenderer):
+    """Renderer that skips animations and records a keyframe per play."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, skip_animations=True, **kwargs)
+        self.assets = {}
+        self.keyframes = []
+        # Read while the render's config is active; it reverts when render_scene returns
+        self.canvas = {
+            "width": self.camera.pixel_width,
+            "height": self.camera.pixel_height,
+            "background": ManimColor(self.camera.background_color).to_hex(),
+        }
+
+    def play(self, scene, *args, **kwargs):
+        start = scene.time
+        super().play(scene, *args, **kwargs)
+        section = self.file_writer.sections[-1].name if self.file_writer.sections else ""
+        on_screen = list(getattr(scene, "static_layer", [])) + scene.mobjects
+        ids = [asset_id for asset_id in map(self.add_asset, on_screen) if asset_id]
+
+        previous = self.keyframes[-1] if self.keyframes else None
+        if previous and previous["mobjects"] == ids and previous["section"] == section:
+            # Waits and no-op plays just hold the previous keyframe longer
+            previous["end"] = round(scene.time, 3)
+        else:
+            self.keyframes.append({
+                "start": round(start, 3),
+                "end": round(scene.time, 3),
+                "run_time": round(scene.time - start, 3),
+                "rate_func": rate_func_name(scene.animations[0]) if scene.animations else "linear",
+                "section": section,
+                "mobjects": ids,
+            })
+
+    def add_asset(self, mob):
+        if not mob.family_members_with_points():
+            return None
+        document = svg_document([mob], transparent=True)
+        asset_id = hashlib.blake2b(document.encode(), digest_size=8).hexdigest()
+        self.assets.setdefault(asset_id, document)
+        return asset_id
+
+
+def rate_func_name(animation):
+    """Name of the easing that shapes ``animation``, looking inside linear groups."""
+    while animation.rate_func is linear and getattr(animation, "animations", None):
+        animation = animation.animations[0]
+    return getattr(animation.rate_func, "__name__", "smooth")
+
+
+def export_web(name, quality="l"):
+    """Write ``timeline.json``, ``assets/`` and ``player.html`` for scene ``name``."""
+    scene = render_scene(
+        name,
+        quality,
+        renderer_class=TimelineRenderer,
+        write_to_movie=False,
+        disable_caching=True
+    )
+    renderer = scene.renderer
+
+    out_dir = WEB_DIR / name
+    asset_dir = out_dir / "assets"
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    for asset_id, document in renderer.assets.items():
+        (asset_dir / f"{asset_id}.svg").write_text(document)
+
+    timeline = {
+        "scene": name,
+        **renderer.canvas,
+        "duration": round(scene.time, 3),
+        "keyframes": renderer.keyframes,
+    }
+    (out_dir / "timeline.json").write_text(json.dumps(timeline, separators=(",", ":")))
+    shutil.copyfile(PLAYER, out_dir / "player.html")
+    return out_dir